@@ -1,33 +1,37 @@
-
 from sqlite3 import connect as sqlite3_connect
 
+DEFAULT_ICON_PATH = 'Icons/mimetypes/application-x-zerosize.svg'
+
 
 class DatabaseManager:
     def __init__(self, db_path):
-        self.db_conn = sqlite3_connect(db_path)
-
-    def __del__(self):
-        self.db_conn.close()
-
-    def get_icon_path(self, icon_type, identifier):
-        c = self.db_conn.cursor()
+        # The icon table is small and looked up for every tree and listing row, so it is read once
+        # here; lookups never touch SQLite afterwards and are safe from any thread
+        self.icon_paths = self.load_icon_paths(db_path)
+
+    @staticmethod
+    def load_icon_paths(db_path):
+        """Return {(type, extension): path} for the whole icon table in one query."""
+        icon_paths = {}
+        db_conn = sqlite3_connect(db_path)
         try:
-            # First, try to get the icon for the specific identifier
-            c.execute("SELECT path FROM icons WHERE type = ? AND extention = ?", (icon_type, identifier))
-            result = c.fetchone()
-
-            # If a specific icon exists for the identifier, return it
-            if result:
-                return result[0]
+            for icon_type, identifier, path in db_conn.execute("SELECT type, extention, path FROM icons"):
+                # NULL columns never matched the per-icon query, so leave them out
+                if icon_type is not None and identifier is not None:
+                    icon_paths.setdefault((icon_type, identifier), path)
+        finally:
+            db_conn.close()
+        return icon_paths
 
-            # If no specific icon exists, check for default icons
-            if icon_type == 'folder':
-                c.execute("SELECT path FROM icons WHERE type = ? AND extention = 'folder'", (icon_type,))
+    def get_icon_path(self, icon_type, identifier):
+        # First, try to get the icon for the specific identifier
+        path = self.icon_paths.get((icon_type, identifier))
 
-                result = c.fetchone()
-                return result[0] if result else 'Icons/mimetypes/application-x-zerosize.svg'
-            else:
-                return 'Icons/mimetypes/application-x-zerosize.svg'
-        finally:
-            c.close()
+        # If a specific icon exists for the identifier, return it
+        if path:
+            return path
 
+        # If no specific icon exists, check for default icons
+        if icon_type == 'folder':
+            return self.icon_paths.get(('folder', 'folder')) or DEFAULT_ICON_PATH
+        return DEFAULT_ICON_PATH
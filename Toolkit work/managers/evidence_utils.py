@@ -1,57 +1,333 @@
 
 
 import hashlib
+import io
+import mmap
 import os
-import datetime
-from Registry import Registry
-import pyewf
+import functools
 import pytsk3
-import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 SECTOR_SIZE = 512  # 512 bytes per sector
 # Optimized buffer sizes for faster reading
 READ_BUFFER_SIZE = 1024 * 1024  # 1MB buffer for regular reads
+HASH_BUFFER_SIZE = 4 * 1024 * 1024  # 4MB chunks when hashing whole images (amortizes thread hand-offs)
 LARGE_FILE_THRESHOLD = 10 * 1024 * 1024  # 10MB - use chunked reading for larger files
 CHUNK_SIZE = 8 * 1024 * 1024  # 8MB chunks for large files
+FILE_STREAM_BUFFER_SIZE = 64 * 1024  # Read-ahead for seekable streams over files in the image
+HASH_ALGORITHMS = ("md5", "sha1", "sha256")
+HAS_FADVISE = hasattr(os, "posix_fadvise")  # Linux only; page-cache hints are skipped elsewhere
+DIRECTORY_CACHE_SIZE = 4096  # Max directory listings kept in memory per image
+METADATA_CACHE_SIZE = 65536  # Max file metadata records kept in memory per image
+DOT_ENTRIES = (b".", b"..")  # Self/parent links to skip when listing directories
+INODE_KEY_BITS = 48  # NTFS file references use 48-bit MFT entry numbers
+
+# Values read from SOFTWARE\Microsoft\Windows NT\CurrentVersion for the OS summary
+# (lower-cased, since registry value names are case-insensitive)
+WINDOWS_VERSION_VALUES = frozenset(("productname", "currentversion", "currentbuild",
+                                    "registeredowner", "csdversion", "productid"))
+
+# Map TSK file system types to display names
+FS_TYPE_NAMES = {
+    pytsk3.TSK_FS_TYPE_NTFS: "NTFS",
+    pytsk3.TSK_FS_TYPE_FAT12: "FAT12",
+    pytsk3.TSK_FS_TYPE_FAT16: "FAT16",
+    pytsk3.TSK_FS_TYPE_FAT32: "FAT32",
+    pytsk3.TSK_FS_TYPE_EXFAT: "ExFAT",
+    pytsk3.TSK_FS_TYPE_EXT2: "Ext2",
+    pytsk3.TSK_FS_TYPE_EXT3: "Ext3",
+    pytsk3.TSK_FS_TYPE_EXT4: "Ext4",
+    pytsk3.TSK_FS_TYPE_ISO9660: "ISO9660",
+    pytsk3.TSK_FS_TYPE_HFS: "HFS",
+    pytsk3.TSK_FS_TYPE_APFS: "APFS",
+}
+
+
+class LRUCache(OrderedDict):
+    """Dict that keeps at most `capacity` entries, evicting the least recently used."""
+
+    def __init__(self, capacity):
+        super().__init__()
+        self.capacity = capacity
+
+    def lookup(self, key):
+        """Return the cached value (marking it recently used), or None on a miss."""
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            return None
+        return self[key]
+
+    def store(self, key, value):
+        self[key] = value
+        self.move_to_end(key)
+        if len(self) > self.capacity:
+            self.popitem(last=False)
+
+
+def cache_key(start_offset, inode_number):
+    """Pack a partition offset and inode into one int (cheaper to hash than a tuple)."""
+    # None and 0 both mean the root directory in get_directory_contents
+    return (start_offset << INODE_KEY_BITS) | (inode_number or 0)
+
+
+def serialized(method):
+    """Run an ImageHandler method under its TSK lock; TSK handles aren't thread-safe."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.tsk_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def open_ewf_handle(image_path):
+    """Open all segments of an EWF image with libewf."""
+    # Imported on first use: libewf is only needed for EWF images and loads a large native library
+    import pyewf
+
+    ewf_handle = pyewf.handle()
+    ewf_handle.open(pyewf.glob(image_path))
+    return ewf_handle
+
+
+def new_hasher(name):
+    """Create an OpenSSL-backed hash object (picks up SHA-NI/AVX2 code paths where the CPU has them)."""
+    return hashlib.new(name, usedforsecurity=False)
+
+
+class FusedHasher:
+    """Several digests fed from one buffer per update, each running in parallel on a worker thread.
+
+    `hashers` maps display names to hash objects (MD5, SHA1 and SHA256 by default). Without an
+    executor the hasher runs its own workers until finalize()/close().
+    A chunk passed to update() must stay unchanged until the following update()/finalize() call.
+    """
+
+    def __init__(self, executor=None, hashers=None):
+        if hashers is None:
+            hashers = {name.upper(): new_hasher(name) for name in HASH_ALGORITHMS}
+        self.names = tuple(hashers)
+        self._hashers = list(hashers.values())
+        self._updates = [hasher.update for hasher in self._hashers]
+        self._own_executor = None
+        if executor is None:
+            executor = self._own_executor = ThreadPoolExecutor(max_workers=len(self._hashers))
+        self._submit = executor.submit
+        self._pending = ()
+        self.size = 0
+
+    def update(self, chunk):
+        # Each digest must see the chunks in order, so wait for the previous chunk first
+        for future in self._pending:
+            future.result()
+        submit = self._submit
+        self._pending = [submit(update, chunk) for update in self._updates]
+        self.size += len(chunk)
+
+    def finalize(self):
+        """Wait for outstanding updates and return the hex digests, in the order of `names`."""
+        self.close()
+        return tuple(hasher.hexdigest() for hasher in self._hashers)
+
+    def digests(self):
+        """Like finalize(), as a {name: hex digest} dict."""
+        return dict(zip(self.names, self.finalize()))
+
+    def close(self):
+        """Wait for outstanding updates (so their buffers can be reused) and stop any private workers."""
+        pending, self._pending = self._pending, ()
+        try:
+            for future in pending:
+                future.result()
+        finally:
+            if self._own_executor is not None:
+                self._own_executor.shutdown()
+                self._own_executor = None
+
+
+def read_file_chunks(f, buffer_size=HASH_BUFFER_SIZE):
+    """Yield memoryview chunks of a binary file, alternating between two preallocated buffers.
+
+    A chunk stays valid until the one after it has been requested, so the next read can
+    overlap with work still running on the previous chunk.
+    """
+    buffers = (memoryview(bytearray(buffer_size)), memoryview(bytearray(buffer_size)))
+    index = 0
+    while True:
+        view = buffers[index]
+        n = f.readinto(view)
+        if not n:
+            return
+        yield view[:n]
+        index ^= 1
+
+
+@functools.lru_cache(maxsize=65536)
+def safe_datetime(timestamp, suffix=""):
+    """Format a filesystem timestamp as a UTC date string, or "N/A" if it's missing/invalid.
+
+    Cached because timestamps repeat heavily across a directory.
+    """
+    if timestamp is None:
+        return "N/A"
+    try:
+        utc = time.gmtime(timestamp)
+    except (OverflowError, OSError, ValueError):
+        return "N/A"
+    # Corrupt values can land outside years 1-9999, which datetime (and the listing) never showed
+    if not 1 <= utc.tm_year <= 9999:
+        return "N/A"
+    return time.strftime('%Y-%m-%d %H:%M:%S', utc) + suffix
+
+
+def utc_datetime(timestamp):
+    """Like safe_datetime, with a " UTC" suffix and 0 treated as unset (directory listings)."""
+    return safe_datetime(timestamp, " UTC") if timestamp else "N/A"
+
+
+def file_extension(file_name):
+    """Lower-cased extension with its dot, same rules as os.path.splitext (leading dots don't count)."""
+    base, dot, extension = file_name.rpartition('.')
+    if not dot or not base.strip('.'):
+        return ''
+    return '.' + extension.lower()
+
+
+def file_matcher(extensions, search_query):
+    """Pick the file-name predicate for a search once, instead of re-branching for every file."""
+    if search_query:
+        query = search_query.lower()
+        if query.startswith('.'):
+            # If the search query is an extension (e.g., '.jpg')
+            return lambda file_name: file_extension(file_name) == query
+        # If the search query is a file name or part of it
+        return lambda file_name: query in file_name.lower()
+    if extensions is None or '' in extensions:
+        return lambda file_name: True
+    return lambda file_name: file_extension(file_name) in extensions
+
+
+def slice_chunks(view, chunk_size=HASH_BUFFER_SIZE):
+    """Yield zero-copy memoryview slices of a buffer."""
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+
+def read_file_object(file_obj, file_size, chunk_size=CHUNK_SIZE):
+    """Read a TSK file object in chunks into a buffer preallocated to `file_size`."""
+    data = bytearray(file_size)
+    written = 0
+    with memoryview(data) as view:
+        while written < file_size:
+            chunk = file_obj.read_random(written, min(file_size - written, chunk_size))
+            if not chunk:
+                break
+            view[written:written + len(chunk)] = chunk
+            written += len(chunk)
+    if written < file_size:
+        del data[written:]
+    # Callers (viewers, zipfile, PIL, ...) expect immutable bytes
+    return bytes(data)
+
+
+def drop_behind(chunks, fd, mapped=None):
+    """Pass hashing chunks through, evicting each one from the page cache once it has been hashed.
+
+    With FusedHasher a chunk is done once the chunk two after it is requested. Offsets stay
+    page aligned because every chunk but the last is a whole HASH_BUFFER_SIZE.
+    """
+    lengths = deque()
+    done = 0
+    for chunk in chunks:
+        lengths.append(len(chunk))
+        if len(lengths) > 2:
+            length = lengths.popleft()
+            if mapped is not None:
+                # Unmap our own pages first, otherwise the kernel won't drop them
+                mapped.madvise(mmap.MADV_DONTNEED, done, length)
+            os.posix_fadvise(fd, done, length, os.POSIX_FADV_DONTNEED)
+            done += length
+        yield chunk
 
 
 # Class to handle EWF images
+class TSKFileReader(io.RawIOBase):
+    """Seekable, read-only stream over a file inside the image; only the ranges read are fetched."""
+
+    def __init__(self, tsk_lock, file_obj, file_size):
+        super().__init__()
+        self._tsk_lock = tsk_lock
+        self._file_obj = file_obj
+        self._size = file_size
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self._size - self._pos)
+        if size <= 0:
+            return 0
+        with self._tsk_lock:
+            data = self._file_obj.read_random(self._pos, size)
+        read = len(data)
+        buffer[:read] = data
+        self._pos += read
+        return read
+
+
 class EWFImgInfo(pytsk3.Img_Info):
     def __init__(self, ewf_handle):
         self._ewf_handle = ewf_handle
-        self._last_offset = -1  # Cache last offset to avoid unnecessary seeks
+        # Bound positioned read: TSK calls read() millions of times during a partition walk,
+        # so each call is a single Python->C hop with no seek bookkeeping
+        self._read_at = ewf_handle.read_buffer_at_offset
         super(EWFImgInfo, self).__init__(url="", type=pytsk3.TSK_IMG_TYPE_EXTERNAL)
 
     def close(self):
         self._ewf_handle.close()
 
     def read(self, offset, size):
-        # Only seek if offset changed (optimization to reduce seek calls)
-        if self._last_offset != offset:
-            self._ewf_handle.seek(offset)
-            self._last_offset = offset
-        
-        # Use optimized buffer size for large reads
-        if size > READ_BUFFER_SIZE:
-            # For large reads, read in chunks to avoid memory issues
-            data = bytearray()
-            remaining = size
-            current_offset = offset
-            while remaining > 0:
-                chunk_size = min(remaining, READ_BUFFER_SIZE)
-                self._ewf_handle.seek(current_offset)
-                chunk = self._ewf_handle.read(chunk_size)
+        if size <= READ_BUFFER_SIZE:
+            return self._read_at(size, offset)
+
+        # For large reads, read in chunks into one preallocated buffer
+        read_at = self._read_at
+        data = bytearray(size)
+        written = 0
+        with memoryview(data) as view:
+            while written < size:
+                chunk = read_at(min(size - written, READ_BUFFER_SIZE), offset + written)
                 if not chunk:
                     break
-                data.extend(chunk)
-                remaining -= len(chunk)
-                current_offset += len(chunk)
-            self._last_offset = current_offset
-            return bytes(data)
-        else:
-            data = self._ewf_handle.read(size)
-            self._last_offset = offset + len(data) if data else offset
-            return data
+                view[written:written + len(chunk)] = chunk
+                written += len(chunk)
+        if written < size:
+            del data[written:]
+        return bytes(data)
 
     def get_size(self):
         return self._ewf_handle.get_media_size()
@@ -64,15 +340,20 @@ class ImageHandler:
         self.volume_info = None  # Initialized lazily
         self._volume_info_loaded = False  # Track if volume_info has been loaded
         self.fs_info_cache = {}  # Cache for FS_Info objects, keyed by start offset
-        self.file_metadata_cache = {}  # Cache for file metadata to avoid re-traversing
-        self.directory_cache = {}  # Cache for directory contents
+        self.file_metadata_cache = LRUCache(METADATA_CACHE_SIZE)  # Cache for file metadata to avoid re-traversing
+        self.directory_cache = LRUCache(DIRECTORY_CACHE_SIZE)  # Cache for directory contents
+        # The GUI reads files while the tree is filled from a background thread; TSK calls take turns
+        self.tsk_lock = threading.RLock()
 
         self.fs_info = None  # Added to check for direct filesystem
         self.is_wiped_image = False  # Indicator if image is wiped
+        # One worker per digest; hashlib releases the GIL on large buffers so they run in parallel
+        self._hash_executor = ThreadPoolExecutor(max_workers=len(HASH_ALGORITHMS))
 
         # Only load basic image info, defer volume_info loading
         self._load_basic_image_info()
 
+    @serialized
     def get_size(self):
         """Returns the size of the disk image."""
         if isinstance(self.img_info, EWFImgInfo):
@@ -82,6 +363,7 @@ class ImageHandler:
         else:
             raise AttributeError("Unsupported image format for size retrieval.")
 
+    @serialized
     def read(self, offset, size):
         """Reads data from the image starting at `offset` for `size` bytes."""
         if hasattr(self.img_info, 'read'):
@@ -107,53 +389,86 @@ class ImageHandler:
         else:
             raise ValueError(f"Unsupported image type: {extension}")
 
+    def _hash_chunks(self, chunks):
+        """Hash a stream of chunks; returns (md5, sha1, sha256, size).
+
+        Chunk N is hashed while the read for chunk N+1 is in flight.
+        """
+        hasher = FusedHasher(self._hash_executor)
+        update = hasher.update
+        for chunk in chunks:
+            update(chunk)
+        return hasher.finalize() + (hasher.size,)
+
     def calculate_hashes(self):
-        """Calculate the MD5, SHA1, and SHA256 hashes for the image with optimized reading."""
-        hash_md5 = hashlib.md5()
-        hash_sha1 = hashlib.sha1()
-        hash_sha256 = hashlib.sha256()
+        """Calculate the MD5, SHA1, and SHA256 hashes for the image in a single read pass.
+
+        For EWF images the hashes stored in the image are returned alongside, for comparison.
+        """
+        md5_hex = sha1_hex = sha256_hex = None
         size = 0
-        stored_md5, stored_sha1 = None, None
+        stored_md5, stored_sha1, stored_sha256 = None, None, None
 
         image_type = self.get_image_type()
         if image_type == "ewf":
-            filenames = pyewf.glob(self.image_path)
-            ewf_handle = pyewf.handle()
-            ewf_handle.open(filenames)
+            ewf_handle = open_ewf_handle(self.image_path)
             try:
                 # Attempt to retrieve the stored hash values
                 stored_md5 = ewf_handle.get_hash_value("MD5")
                 stored_sha1 = ewf_handle.get_hash_value("SHA1")
             except Exception as e:
                 pass  # Silently skip if hash values not available
+            try:
+                # Only EWF2 (Ex01) images store a SHA256
+                stored_sha256 = ewf_handle.get_hash_value("SHA256")
+            except Exception:
+                pass
 
-            # Calculate the hash values by reading the image file with larger buffer
-            while True:
-                chunk = ewf_handle.read(READ_BUFFER_SIZE)  # Use larger buffer for faster hashing
-                if not chunk:
-                    break
-                hash_md5.update(chunk)
-                hash_sha1.update(chunk)
-                hash_sha256.update(chunk)
-                size += len(chunk)
-            ewf_handle.close()
+            try:
+                # libewf hands back a fresh buffer per read, so just feed it straight to the hashers
+                md5_hex, sha1_hex, sha256_hex, size = self._hash_chunks(iter(lambda: ewf_handle.read(HASH_BUFFER_SIZE), b""))
+            finally:
+                ewf_handle.close()
         elif image_type == "raw":
+            # One pass over the image feeds all three digests
             with open(self.image_path, "rb") as f:
-                for chunk in iter(lambda: f.read(READ_BUFFER_SIZE), b""):  # Use larger buffer
-                    hash_md5.update(chunk)
-                    hash_sha1.update(chunk)
-                    hash_sha256.update(chunk)
-                    size += len(chunk)
+                fd = f.fileno()
+                if HAS_FADVISE:
+                    # Read-once data: ask for aggressive readahead and keep it from
+                    # evicting the MFT/metadata pages the rest of the app relies on
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                try:
+                    mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty files and some network filesystems can't be mapped
+                    chunks = read_file_chunks(f)
+                    if HAS_FADVISE:
+                        chunks = drop_behind(chunks, fd)
+                    md5_hex, sha1_hex, sha256_hex, size = self._hash_chunks(chunks)
+                else:
+                    with mapped:
+                        if hasattr(mapped, "madvise"):  # Not available on Windows
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        # Hash straight out of the page cache; no per-chunk bytes objects
+                        with memoryview(mapped) as view:
+                            chunks = slice_chunks(view)
+                            if HAS_FADVISE:
+                                chunks = drop_behind(chunks, fd, mapped)
+                            md5_hex, sha1_hex, sha256_hex, size = self._hash_chunks(chunks)
+                if HAS_FADVISE:
+                    # Release whatever is left (the last chunks) now that hashing is done
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
 
         # Compile the computed and stored hashes in a dictionary
         hashes = {
-            'computed_md5': hash_md5.hexdigest(),
-            'computed_sha1': hash_sha1.hexdigest(),
-            'computed_sha256': hash_sha256.hexdigest(),
+            'computed_md5': md5_hex,
+            'computed_sha1': sha1_hex,
+            'computed_sha256': sha256_hex,
             'size': size,
             'path': self.image_path,
             'stored_md5': stored_md5,
-            'stored_sha1': stored_sha1
+            'stored_sha1': stored_sha1,
+            'stored_sha256': stored_sha256
         }
 
         return hashes
@@ -162,9 +477,7 @@ class ImageHandler:
         """Load only basic image info without volume_info for faster initial loading."""
         image_type = self.get_image_type()
         if image_type == "ewf":
-            filenames = pyewf.glob(self.image_path)
-            ewf_handle = pyewf.handle()
-            ewf_handle.open(filenames)
+            ewf_handle = open_ewf_handle(self.image_path)
             self.img_info = EWFImgInfo(ewf_handle)
         elif image_type == "raw":
             self.img_info = pytsk3.Img_Info(self.image_path)
@@ -204,6 +517,7 @@ class ImageHandler:
         # Image is considered wiped if no volume info, no filesystem detected
         return self.is_wiped_image
 
+    @serialized
     def get_partitions(self):
         """Retrieve partitions from the loaded image, or indicate unpartitioned space."""
         # Lazy load volume_info only when partitions are requested
@@ -224,6 +538,7 @@ class ImageHandler:
             pass
         return partitions
 
+    @serialized
     def get_fs_info(self, start_offset):
         """Retrieve the FS_Info for a partition, initializing it if necessary."""
         if start_offset not in self.fs_info_cache:
@@ -234,6 +549,7 @@ class ImageHandler:
                 return None
         return self.fs_info_cache[start_offset]
 
+    @serialized
     def get_fs_type(self, start_offset):
         """Retrieve the file system type for a partition (lazy loaded)."""
         try:
@@ -241,101 +557,91 @@ class ImageHandler:
             if not fs_info:
                 return "N/A"
             
-            fs_type = fs_info.info.ftype
-
-            # Map the file system type to its name
-            if fs_type == pytsk3.TSK_FS_TYPE_NTFS:
-                return "NTFS"
-            elif fs_type == pytsk3.TSK_FS_TYPE_FAT12:
-                return "FAT12"
-            elif fs_type == pytsk3.TSK_FS_TYPE_FAT16:
-                return "FAT16"
-            elif fs_type == pytsk3.TSK_FS_TYPE_FAT32:
-                return "FAT32"
-            elif fs_type == pytsk3.TSK_FS_TYPE_EXFAT:
-                return "ExFAT"
-            elif fs_type == pytsk3.TSK_FS_TYPE_EXT2:
-                return "Ext2"
-            elif fs_type == pytsk3.TSK_FS_TYPE_EXT3:
-                return "Ext3"
-            elif fs_type == pytsk3.TSK_FS_TYPE_EXT4:
-                return "Ext4"
-            elif fs_type == pytsk3.TSK_FS_TYPE_ISO9660:
-                return "ISO9660"
-            elif fs_type == pytsk3.TSK_FS_TYPE_HFS:
-                return "HFS"
-            elif fs_type == pytsk3.TSK_FS_TYPE_APFS:
-                return "APFS"
-            else:
-                return "Unknown"
+            return FS_TYPE_NAMES.get(fs_info.info.ftype, "Unknown")
         except Exception:
             return "N/A"
 
+    @serialized
     def check_partition_contents(self, partition_start_offset):
         """Check if a partition has any files or folders."""
         fs = self.get_fs_info(partition_start_offset)
         if fs:
             try:
                 root_dir = fs.open_dir(path="/")
-                for _ in root_dir:
-                    return True
-                return False
+                return next(iter(root_dir), None) is not None
             except:
                 return False
         return False
 
+    @serialized
     def get_directory_contents(self, start_offset, inode_number=None):
         """Optimized directory reading with caching and better error handling."""
+        fs = self.get_fs_info(start_offset)
+        if not fs:
+            return []
+
+        # The root can be asked for as None or by its inode (5 on NTFS); both share one cached listing
+        if inode_number == fs.info.root_inum:
+            inode_number = None
+
         # Check cache first
-        cache_key = (start_offset, inode_number)
-        if cache_key in self.directory_cache:
-            return self.directory_cache[cache_key]
+        key = cache_key(start_offset, inode_number)
+        cached = self.directory_cache.lookup(key)
+        if cached is not None:
+            return cached
         
-        fs = self.get_fs_info(start_offset)
-        if fs:
-            try:
-                directory = fs.open_dir(inode=inode_number) if inode_number else fs.open_dir(path="/")
-                entries = []
-                
-                # Use try-except per entry to skip problematic entries faster
-                for entry in directory:
-                    try:
-                        if entry.info.name.name not in [b".", b".."]:
-                            is_directory = False
-                            if entry.info.meta and entry.info.meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
-                                is_directory = True
-
-                            def safe_datetime(timestamp):
-                                if timestamp is None or timestamp == 0:
-                                    return "N/A"
-                                try:
-                                    return datetime.datetime.utcfromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S') + " UTC"
-                                except Exception:
-                                    return "N/A"
-
-                            entries.append({
-                                "name": entry.info.name.name.decode('utf-8', errors='ignore') if hasattr(entry.info.name, 'name') else None,
-                                "is_directory": is_directory,
-                                "inode_number": entry.info.meta.addr if entry.info.meta else None,
-                                "size": entry.info.meta.size if entry.info.meta and entry.info.meta.size is not None else 0,
-                                "accessed": safe_datetime(entry.info.meta.atime) if hasattr(entry.info.meta, 'atime') else "N/A",
-                                "modified": safe_datetime(entry.info.meta.mtime) if hasattr(entry.info.meta, 'mtime') else "N/A",
-                                "created": safe_datetime(entry.info.meta.crtime) if hasattr(entry.info.meta, 'crtime') else "N/A",
-                                "changed": safe_datetime(entry.info.meta.ctime) if hasattr(entry.info.meta, 'ctime') else "N/A",
-                            })
-                    except Exception:
-                        # Skip problematic entries silently to avoid slowing down
+        try:
+            directory = fs.open_dir(inode=inode_number) if inode_number else fs.open_dir(path="/")
+            entries = []
+            
+            dir_type = pytsk3.TSK_FS_META_TYPE_DIR
+
+            for entry in directory:
+                try:
+                    info = entry.info
+                    name = info.name.name
+                    if name in DOT_ENTRIES:
                         continue
-                
-                # Cache the results
-                self.directory_cache[cache_key] = entries
-                return entries
 
-            except Exception as e:
-                # Log only critical errors, skip others silently
-                return []
-        return []
+                    # Fetch the meta wrapper once; it's None for unallocated names
+                    meta = info.meta
+                    if meta is None:
+                        entries.append({
+                            "name": name.decode('utf-8', errors='ignore'),
+                            "is_directory": False,
+                            "inode_number": None,
+                            "size": 0,
+                            "accessed": "N/A",
+                            "modified": "N/A",
+                            "created": "N/A",
+                            "changed": "N/A",
+                        })
+                        continue
+
+                    size = meta.size
+                    entries.append({
+                        "name": name.decode('utf-8', errors='ignore'),
+                        "is_directory": meta.type == dir_type,
+                        "inode_number": meta.addr,
+                        "size": size if size is not None else 0,
+                        "accessed": utc_datetime(meta.atime),
+                        "modified": utc_datetime(meta.mtime),
+                        "created": utc_datetime(meta.crtime),
+                        "changed": utc_datetime(meta.ctime),
+                    })
+                except Exception:
+                    # Skip problematic entries silently to avoid slowing down
+                    continue
 
+            # Cache the results
+            self.directory_cache.store(key, entries)
+            return entries
+
+        except Exception as e:
+            # Log only critical errors, skip others silently
+            return []
+
+    @serialized
     def get_registry_hive(self, fs_info, hive_path):
         """Extract a registry hive from the given filesystem with optimized reading."""
         try:
@@ -344,26 +650,14 @@ class ImageHandler:
             
             # Use chunked reading for large registry files
             if file_size > LARGE_FILE_THRESHOLD:
-                hive_data = bytearray()
-                remaining = file_size
-                current_offset = 0
-                
-                while remaining > 0:
-                    chunk_size = min(remaining, CHUNK_SIZE)
-                    chunk = registry_file.read_random(current_offset, chunk_size)
-                    if not chunk:
-                        break
-                    hive_data.extend(chunk)
-                    remaining -= len(chunk)
-                    current_offset += len(chunk)
-                
-                return bytes(hive_data)
+                return read_file_object(registry_file, file_size)
             else:
                 # For smaller files, read all at once
                 return registry_file.read_random(0, file_size)
         except Exception as e:
             return None
 
+    @serialized
     def get_windows_version(self, start_offset):
         """Get the Windows version from the SOFTWARE registry hive."""
         fs_info = self.get_fs_info(start_offset)
@@ -379,40 +673,30 @@ class ImageHandler:
         if not software_hive_data:
             return None
 
-        # Create a temporary file and store the hive data
-        temp_hive_path = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                    delete=False) as temp_hive:  # Create a temporary file and store the hive data
-                temp_hive.write(software_hive_data)  # Write the hive data to the temporary file
-                temp_hive_path = temp_hive.name  # Get the path of the temporary file
-
-            if temp_hive_path:
-                reg = Registry.Registry(temp_hive_path)
-                key = reg.open("Microsoft\\Windows NT\\CurrentVersion")
-
-                # Helper function to safely get registry values
-                def get_reg_value(reg_key, value_name):
-                    try:
-                        return reg_key.value(value_name).value()
-                    except Registry.RegistryValueNotFoundException:
-                        return "N/A"
-
-                # Fetching registry values
-                product_name = get_reg_value(key, "ProductName")
-                current_version = get_reg_value(key, "CurrentVersion")
-                current_build = get_reg_value(key, "CurrentBuild")
-                registered_owner = get_reg_value(key, "RegisteredOwner")
-                csd_version = get_reg_value(key, "CSDVersion")
-                product_id = get_reg_value(key, "ProductId")
-
-                os_version = f"{product_name} Version {current_version}\nBuild {current_build} {csd_version}\nOwner: {registered_owner}\nProduct ID: {product_id}"
-            else:
-                os_version = "Failed to create temporary hive file"
+        # Imported on first use; only needed when looking at NTFS partitions
+        from Registry import Registry
 
-            # Clean up the temporary file
-            if temp_hive_path and os.path.exists(temp_hive_path):
-                os.remove(temp_hive_path)
+        try:
+            # python-registry reads from any file-like object, so parse the hive straight from memory
+            reg = Registry.Registry(io.BytesIO(software_hive_data))
+            key = reg.open("Microsoft\\Windows NT\\CurrentVersion")
+
+            # Collect the values we need in a single pass over the key
+            values = {}
+            for value in key.values():
+                value_name = value.name().lower()
+                if value_name in WINDOWS_VERSION_VALUES:
+                    values[value_name] = value.value()
+
+            def get_reg_value(value_name):
+                return values.get(value_name.lower(), "N/A")
+
+            os_version = "\n".join([
+                f"{get_reg_value('ProductName')} Version {get_reg_value('CurrentVersion')}",
+                f"Build {get_reg_value('CurrentBuild')} {get_reg_value('CSDVersion')}",
+                f"Owner: {get_reg_value('RegisteredOwner')}",
+                f"Product ID: {get_reg_value('ProductId')}",
+            ])
 
             return os_version
 
@@ -420,6 +704,7 @@ class ImageHandler:
             print(f"Error parsing SOFTWARE hive: {e}")
             return "Error in parsing OS version"
 
+    @serialized
     def read_unallocated_space(self, start_offset, end_offset):
         try:
             start_byte_offset = start_offset * SECTOR_SIZE
@@ -442,28 +727,39 @@ class ImageHandler:
 
     def open_image(self):
         if self.get_image_type() == "ewf":
-            filenames = pyewf.glob(self.image_path)
-            ewf_handle = pyewf.handle()
-            ewf_handle.open(filenames)
+            ewf_handle = open_ewf_handle(self.image_path)
             return EWFImgInfo(ewf_handle)
         else:
             return pytsk3.Img_Info(self.image_path)
 
 
     def list_files(self, extensions=None):
-        files_list = []
+        if extensions is not None:
+            extensions = frozenset(extension.lower() for extension in extensions)
+        return self._search_partitions(extensions, None)
 
+    def _search_partitions(self, extensions, search_query):
+        """Collect matching files from every allocated partition, in partition order."""
         img_info = self.open_image()
         try:
             volume_info = pytsk3.Volume_Info(img_info)
-            for partition in volume_info:
-                if partition.flags == pytsk3.TSK_VS_PART_FLAG_ALLOC:
-                    self.process_partition(img_info, partition.start * SECTOR_SIZE, files_list, extensions)
+            offsets = [partition.start * SECTOR_SIZE for partition in volume_info
+                       if partition.flags == pytsk3.TSK_VS_PART_FLAG_ALLOC]
         except IOError:
-            self.process_partition(img_info, 0, files_list, extensions)
+            # No volume information, attempt to read as a single filesystem
+            offsets = [0]
 
+        files_list = []
+        for offset in offsets:
+            self._process_partition(img_info, offset, files_list, extensions, search_query)
         return files_list
 
+    def _process_partition(self, img_info, offset, files_list, extensions, search_query):
+        if search_query is None:
+            self.process_partition(img_info, offset, files_list, extensions)
+        else:
+            self.process_partition_search(img_info, offset, files_list, search_query)
+
     def process_partition(self, img_info, offset, files_list, extensions):
         try:
             fs_info = pytsk3.FS_Info(img_info, offset=offset)
@@ -473,52 +769,41 @@ class ImageHandler:
 
 
     def recursive_file_search(self, fs_info, directory, parent_path, files_list, extensions, search_query=None):
-        """Optimized recursive file search with better error handling."""
-        for entry in directory:
-            try:
-                if entry.info.name.name in [b".", b".."]:
-                    continue
-
-                file_name = entry.info.name.name.decode("utf-8", errors='ignore')
-                file_extension = os.path.splitext(file_name)[1].lower()
-
-                if search_query:
-                    # If there's a search query, check if the file name contains the query
-                    if search_query.startswith('.'):
-                        # If the search query is an extension (e.g., '.jpg')
-                        query_matches = file_extension == search_query.lower()
-                    else:
-                        # If the search query is a file name or part of it
-                        query_matches = search_query.lower() in file_name.lower()
-                else:
-                    # If no search query, handle as before based on extensions
-                    query_matches = extensions is None or file_extension in extensions or '' in extensions
-
-                if entry.info.meta and entry.info.meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
-                    try:
-                        sub_directory = fs_info.open_dir(inode=entry.info.meta.addr)
-                        self.recursive_file_search(fs_info, sub_directory, os.path.join(parent_path, file_name), files_list,
-                                                   extensions, search_query)
-                    except (IOError, Exception):
-                        # Skip problematic directories silently to avoid slowing down
+        """Walk the directory tree depth-first, in the same order as a recursive walk, without recursion."""
+        matches = file_matcher(extensions, search_query)
+        dir_type = pytsk3.TSK_FS_META_TYPE_DIR
+        reg_type = pytsk3.TSK_FS_META_TYPE_REG
+        # (directory iterator, path) per open directory; a sub-directory is walked as soon as it is found
+        stack = deque([(iter(directory), parent_path)])
+        while stack:
+            entries, path = stack[-1]
+            for entry in entries:
+                try:
+                    name = entry.info.name.name
+                    if name in DOT_ENTRIES:
                         continue
 
-                elif entry.info.meta and entry.info.meta.type == pytsk3.TSK_FS_META_TYPE_REG and query_matches:
-                    file_info = self.get_file_metadata(entry, parent_path)
-                    files_list.append(file_info)
-            except Exception:
-                # Skip problematic entries silently to avoid slowing down
-                continue
+                    file_name = name.decode("utf-8", errors='ignore')
+                    meta = entry.info.meta
 
-    def get_file_metadata(self, entry, parent_path):
-        def safe_datetime(timestamp):
-            if timestamp is None:
-                return "N/A"
-            try:
-                return datetime.datetime.utcfromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-            except Exception:
-                return "N/A"
+                    if meta and meta.type == dir_type:
+                        try:
+                            sub_directory = iter(fs_info.open_dir(inode=meta.addr))
+                        except Exception:
+                            # Skip problematic directories silently to avoid slowing down
+                            continue
+                        stack.append((sub_directory, os.path.join(path, file_name)))
+                        break
 
+                    elif meta and meta.type == reg_type and matches(file_name):
+                        files_list.append(self.get_file_metadata(entry, path))
+                except Exception:
+                    # Skip problematic entries silently to avoid slowing down
+                    continue
+            else:
+                stack.pop()
+
+    def get_file_metadata(self, entry, parent_path):
         file_name = entry.info.name.name.decode("utf-8")
         return {
             "name": file_name,
@@ -533,19 +818,7 @@ class ImageHandler:
 
 
     def search_files(self, search_query=None):
-        files_list = []
-        img_info = self.open_image()
-
-        try:
-            volume_info = pytsk3.Volume_Info(img_info)
-            for partition in volume_info:
-                if partition.flags == pytsk3.TSK_VS_PART_FLAG_ALLOC:
-                    self.process_partition_search(img_info, partition.start * SECTOR_SIZE, files_list, search_query)
-        except IOError:
-            # No volume information, attempt to read as a single filesystem
-            self.process_partition_search(img_info, 0, files_list, search_query)
-
-        return files_list
+        return self._search_partitions(None, search_query)
 
     def process_partition_search(self, img_info, offset, files_list, search_query):
         try:
@@ -555,6 +828,7 @@ class ImageHandler:
             print(f"Unable to open file system for search: {e}")
 
 
+    @serialized
     def get_file_content(self, inode_number, offset):
         """Optimized file reading with chunked reading for large files."""
         fs = self.get_fs_info(offset)
@@ -572,20 +846,7 @@ class ImageHandler:
             # Use chunked reading for large files to avoid memory issues and improve performance
             if file_size > LARGE_FILE_THRESHOLD:
                 # Read in chunks for large files
-                content = bytearray()
-                remaining = file_size
-                current_offset = 0
-                
-                while remaining > 0:
-                    chunk_size = min(remaining, CHUNK_SIZE)
-                    chunk = file_obj.read_random(current_offset, chunk_size)
-                    if not chunk:
-                        break
-                    content.extend(chunk)
-                    remaining -= len(chunk)
-                    current_offset += len(chunk)
-                
-                return bytes(content), metadata
+                return read_file_object(file_obj, file_size), metadata
             else:
                 # For smaller files, read all at once (faster for small files)
                 content = file_obj.read_random(0, file_size)
@@ -595,6 +856,36 @@ class ImageHandler:
             # Silently skip problematic files to avoid slowing down the process
             return None, None
 
+    @serialized
+    def open_file(self, inode_number, offset):
+        """Open a file in the image as a buffered, seekable stream, or return None if it is empty or unreadable."""
+        fs = self.get_fs_info(offset)
+        if not fs:
+            return None
+
+        try:
+            file_obj = fs.open_meta(inode=inode_number)
+            file_size = file_obj.info.meta.size
+            if not file_size:
+                return None
+            return io.BufferedReader(TSKFileReader(self.tsk_lock, file_obj, file_size), FILE_STREAM_BUFFER_SIZE)
+        except Exception:
+            return None
+
+    @serialized
+    def get_file_header(self, inode_number, offset, size=4):
+        """Read only the first `size` bytes of a file, e.g. to check its signature."""
+        fs = self.get_fs_info(offset)
+        if not fs:
+            return None
+
+        try:
+            file_obj = fs.open_meta(inode=inode_number)
+            read_size = min(size, file_obj.info.meta.size)
+            return file_obj.read_random(0, read_size) if read_size > 0 else None
+        except Exception:
+            return None
+
 
 
     def clear_cache(self):
@@ -4,17 +4,219 @@ Handles acquisition of disk images from digital devices (USB drives, external dr
 and conversion of disk images to E01 format
 """
 
+import errno
+import glob
 import os
 import platform
+import plistlib
+import re
+import shutil
+import signal
+import stat
 import subprocess
-import hashlib
+import mmap
+import queue
 import threading
+import time
 from datetime import datetime
-from PySide6.QtCore import QThread, Signal, QObject
+from PySide6.QtCore import QThread, Signal, QObject, QTimer, Qt
+from PySide6.QtGui import QStandardItemModel, QStandardItem
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
                                QPushButton, QProgressBar, QTextEdit, QFileDialog, 
                                QMessageBox, QGroupBox, QFormLayout, QLineEdit, QCheckBox)
 
+from managers.evidence_utils import FusedHasher, new_hasher, read_file_chunks, slice_chunks
+
+# Number of block buffers kept in flight between the device reader and the image writer
+COPY_RING_SIZE = 8
+# Privilege escalation helpers, looked up once instead of probing with `which` per acquisition
+PKEXEC_PATH = shutil.which('pkexec')
+GKSUDO_PATH = shutil.which('gksudo')
+# Resolved once so conversions don't spawn `ewfacquire --version` just to check it exists
+EWFACQUIRE_PATH = shutil.which('ewfacquire')
+
+# Tools like dd rewrite their progress line with carriage returns, so split on both
+OUTPUT_LINE_RE = re.compile(rb'[\r\n]')
+# ewfacquire progress: either a percentage ("45%") or a byte count ("1234567 bytes")
+EWF_PROGRESS_RE = re.compile(rb'(\d+(?:\.\d+)?)\s*%|(\d[\d,]*)\s+bytes', re.IGNORECASE)
+# Pipe buffer size for reading tool output in binary mode
+OUTPUT_BUFFER_SIZE = 64 * 1024
+# How long a cancelled tool gets to exit after SIGTERM before it is killed
+KILL_GRACE_SECONDS = 0.5
+
+# Page cache hints are only available on POSIX systems
+HAS_FADVISE = hasattr(os, 'posix_fadvise')
+# How much of the copy is done between dropping the already-copied pages from the page cache
+DROP_BEHIND_BYTES = 64 * 1024 * 1024
+
+# Bytes handed to the kernel per copy_file_range/sendfile call when the source is an image file
+KERNEL_COPY_CHUNK = 64 * 1024 * 1024
+
+# Minimum time between progress updates sent to the UI (10 per second)
+EMIT_INTERVAL_NS = 100_000_000
+
+# Smallest block size used for copying and hashing; smaller reads are dominated by syscall overhead
+MIN_BLOCK_SIZE = 1024 * 1024
+# Upper bound for block sizes suggested by the device or filesystem
+MAX_BLOCK_SIZE = 16 * 1024 * 1024
+# Read size for hashing converted images; large reads keep the hash primitives at full speed
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Human-readable size units and their divisors
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+SIZE_DIVISORS = tuple(1024 ** i for i in range(len(SIZE_UNITS)))
+
+# How long a device enumeration is reused while the system's device state looks unchanged
+DEVICE_CACHE_TTL = 2.0
+# Background device polling interval bounds; the interval doubles while nothing changes
+DEVICE_POLL_MIN_MS = 500
+DEVICE_POLL_MAX_MS = 5000
+
+
+def validate_output_path(output_path, ext):
+    """Normalize an output path, adding ext if missing, and stat it once.
+    
+    Returns the normalized path and its st_mode, or None if nothing exists there yet.
+    """
+    # normpath is only needed when the string has something to collapse
+    if os.sep != '/' or '//' in output_path or '/.' in output_path or output_path.endswith('/'):
+        output_path = os.path.normpath(output_path)
+    
+    # Expand user path if it starts with ~
+    if output_path.startswith('~'):
+        output_path = os.path.expanduser(output_path)
+    
+    # Resolve relative paths
+    if not os.path.isabs(output_path):
+        output_path = os.path.abspath(output_path)
+    
+    try:
+        mode = os.stat(output_path).st_mode
+    except OSError:
+        mode = None
+    
+    # A directory is reported as-is; otherwise make sure the path has the right extension
+    if (mode is None or not stat.S_ISDIR(mode)) and not output_path.endswith(ext):
+        output_path += ext
+        try:
+            mode = os.stat(output_path).st_mode
+        except OSError:
+            mode = None
+    
+    return output_path, mode
+
+
+def start_tool(cmd):
+    """Start an external tool in its own process group, with its output piped in binary mode."""
+    if os.name == 'nt':
+        group_args = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        group_args = {'start_new_session': True}
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            bufsize=OUTPUT_BUFFER_SIZE, **group_args)
+
+
+def stop_tool(process):
+    """Terminate a tool started with start_tool and its children, killing them if they linger."""
+    if process.poll() is not None:
+        return
+    if os.name == 'nt':
+        process.terminate()
+        return
+    
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except OSError:
+        return  # Already gone
+    
+    def kill_after_grace():
+        try:
+            process.wait(timeout=KILL_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+    
+    threading.Thread(target=kill_after_grace, daemon=True).start()
+
+
+def iter_output_lines(stream):
+    """Yield the lines of a binary process stream, treating carriage returns as line breaks."""
+    pending = b''
+    for chunk in iter(lambda: stream.read1(OUTPUT_BUFFER_SIZE), b''):
+        lines = OUTPUT_LINE_RE.split(pending + chunk)
+        pending = lines.pop()
+        for line in lines:
+            if line:
+                yield line
+    if pending:
+        yield pending
+
+
+def find_ewf_segments(base_path):
+    """List the EWF segment files (.e01, .e02, ...) of an image, in segment order."""
+    # One directory scan instead of a stat per possible segment name
+    pattern = glob.escape(base_path) + '.e[0-9][0-9]'
+    segments = glob.glob(pattern) + glob.glob(pattern + '[0-9]')
+    segments.sort(key=lambda path: int(path[len(base_path) + 2:]))
+    return segments
+
+
+def remove_ewf_segments(base_path):
+    """Delete every segment file of a partially written EWF image."""
+    for segment in find_ewf_segments(base_path):
+        try:
+            os.unlink(segment)
+        except FileNotFoundError:
+            pass
+
+
+def write_hash_file(hash_file, text):
+    """Write a hash sidecar file with a single write call."""
+    fd = os.open(hash_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+def format_size(size_bytes):
+    """Format size in human-readable format."""
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Every factor of 1024 is 10 more bits, so the unit index falls out of the bit length
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / SIZE_DIVISORS[index]:.2f} {SIZE_UNITS[index]}"
+
+
+def new_image_hasher():
+    """FusedHasher for acquired images: MD5, SHA1, SHA256, and BLAKE3 if the optional blake3 package is installed."""
+    hashers = {'MD5': new_hasher('md5'), 'SHA1': new_hasher('sha1'), 'SHA256': new_hasher('sha256')}
+    try:
+        from blake3 import blake3
+    except ImportError:
+        pass
+    else:
+        hashers['BLAKE3'] = blake3()
+    return FusedHasher(hashers=hashers)
+
+
+def hash_chunks(thread, hasher, chunks, total_size):
+    """Feed chunks to hasher, reporting progress through thread.hash_progress; returns False if cancelled."""
+    bytes_read = 0
+    last_pct = -1
+    for chunk in chunks:
+        if thread.cancelled:
+            return False
+        hasher.update(chunk)
+        bytes_read += len(chunk)
+        hash_progress = bytes_read * 100 // total_size
+        if hash_progress != last_pct and (hash_progress >= 100 or thread._should_emit()):
+            last_pct = hash_progress
+            thread.hash_progress.emit(f"Calculating hashes... {hash_progress}%")
+    return True
+
 
 class DeviceAcquisitionThread(QThread):
     """Thread for performing disk acquisition without blocking UI."""
@@ -23,18 +225,27 @@ class DeviceAcquisitionThread(QThread):
     finished = Signal(bool, str)  # Success status and message
     hash_progress = Signal(str)  # Hash calculation progress
     
-    def __init__(self, device_path, output_path, format_type, calculate_hash=True, block_size=1024*1024):
+    def __init__(self, device_path, output_path, format_type, calculate_hash=True, block_size=1024*1024,
+                 device_size=None):
         super().__init__()
         self.device_path = device_path
         self.output_path = output_path
         self.format_type = format_type  # 'raw' or 'ewf'
         self.calculate_hash = calculate_hash
-        self.block_size = block_size
+        self.block_size = max(block_size, MIN_BLOCK_SIZE)
         self.cancelled = False
+        self.process = None  # Running ewfacquire, so cancel() can stop it
+        self.image_hashes = None  # Set when the hashes were computed while copying
+        # A size already known from device detection saves probing the device again
+        self._device_size_cache = device_size or None
+        self._last_emit_ns = 0
         
     def cancel(self):
         """Cancel the acquisition process."""
         self.cancelled = True
+        # Stop a running ewfacquire now rather than when it next prints a line
+        if self.process is not None:
+            stop_tool(self.process)
         
     def run(self):
         """Run the acquisition process."""
@@ -49,7 +260,11 @@ class DeviceAcquisitionThread(QThread):
                 
             # Calculate hash if requested
             if self.calculate_hash and not self.cancelled:
-                self._calculate_hashes()
+                if self.image_hashes:
+                    self._save_hashes(self.image_hashes)
+                else:
+                    self._sync_output()
+                    self._calculate_hashes()
                 
             if not self.cancelled:
                 self.finished.emit(True, f"Acquisition completed successfully: {self.output_path}")
@@ -68,22 +283,7 @@ class DeviceAcquisitionThread(QThread):
             self.status.emit("Warning: Could not determine device size. Will read until end of device.")
             device_size = 0  # Will be determined during acquisition
         
-        self.status.emit(f"Starting raw acquisition from {self.device_path}...")
-        
-        if system == 'Linux':
-            self._acquire_raw_linux(device_size)
-        elif system == 'Windows':
-            self._acquire_raw_windows(device_size)
-        elif system == 'Darwin':  # macOS
-            self._acquire_raw_macos(device_size)
-        else:
-            raise Exception(f"Unsupported operating system: {system}")
-    
-    def _acquire_raw_linux(self, device_size):
-        """Acquire raw image on Linux using dd."""
-        bytes_read = 0
-        last_progress = 0
-        progress_counter = 0
+        self.block_size = self._optimal_block_size()
         
         # Validate output path before starting
         if os.path.isdir(self.output_path):
@@ -91,210 +291,408 @@ class DeviceAcquisitionThread(QThread):
         
         # Ensure parent directory exists
         parent_dir = os.path.dirname(self.output_path)
-        if parent_dir and not os.path.exists(parent_dir):
+        if parent_dir:
             try:
                 os.makedirs(parent_dir, exist_ok=True)
             except Exception as e:
                 raise Exception(f"Failed to create parent directory {parent_dir}: {e}")
         
+        self.status.emit(f"Starting raw acquisition from {self.device_path}...")
+        
         try:
-            # Use dd to copy device to file
-            # Note: May require sudo for raw device access
-            cmd = ['dd', f'if={self.device_path}', f'of={self.output_path}', 
-                   f'bs={self.block_size}', 'status=progress', 'conv=noerror,sync']
-            
-            # Check if we can read the device without sudo first
-            needs_sudo = False
+            if system == 'Linux':
+                self._acquire_raw_linux(device_size)
+            elif system == 'Windows':
+                self._acquire_raw_windows(device_size)
+            elif system == 'Darwin':  # macOS
+                self._acquire_raw_macos(device_size)
+            else:
+                raise Exception(f"Unsupported operating system: {system}")
+        except Exception:
+            if os.path.exists(self.output_path):
+                os.remove(self.output_path)
+            raise
+        
+        # Final progress update
+        final_size = os.path.getsize(self.output_path)
+        self.status.emit(f"Acquisition complete. Final size: {self._format_size(final_size)}")
+        self.progress.emit(100)
+    
+    def _optimal_block_size(self):
+        """Pick a block size suited to both the source device and the output filesystem."""
+        candidates = [self.block_size]
+        
+        # Preferred I/O size of the filesystem the image is written to
+        try:
+            output_dir = os.path.dirname(os.path.abspath(self.output_path))
+            candidates.append(getattr(os.stat(output_dir), 'st_blksize', 0))
+        except OSError:
+            pass
+        
+        # Optimal I/O size the device advertises (0 when it has no preference)
+        try:
+            device_name = os.path.basename(self.device_path)
+            with open(f"/sys/block/{device_name}/queue/optimal_io_size", 'r') as f:
+                candidates.append(int(f.read().strip()))
+        except (OSError, ValueError):
+            pass
+        
+        return max(self.block_size, min(max(candidates), MAX_BLOCK_SIZE))
+    
+    def _acquire_raw_linux(self, device_size):
+        """Acquire raw image on Linux, in-process when the device is readable and with dd otherwise."""
+        # Check if we can read the device without sudo first
+        needs_sudo = False
+        device_fd = None
+        try:
+            device_fd = os.open(self.device_path, os.O_RDONLY)
+        except PermissionError:
+            needs_sudo = True
+        except Exception:
+            pass  # Try without sudo first
+        
+        if device_fd is not None:
+            # We already have access, so copy in-process instead of going through dd
+            self.status.emit("Starting acquisition...")
             try:
-                test_fd = os.open(self.device_path, os.O_RDONLY)
-                os.close(test_fd)
-            except PermissionError:
-                needs_sudo = True
-            except Exception:
-                pass  # Try without sudo first
-            
-            if needs_sudo:
-                # Try to use pkexec (GUI sudo prompt) or sudo
-                # Check if pkexec is available (common on Linux desktop)
-                if subprocess.run(['which', 'pkexec'], capture_output=True).returncode == 0:
-                    cmd = ['pkexec'] + cmd
-                    self.status.emit("Using pkexec to request administrator privileges...")
-                elif subprocess.run(['which', 'gksudo'], capture_output=True).returncode == 0:
-                    cmd = ['gksudo'] + cmd
-                    self.status.emit("Using gksudo to request administrator privileges...")
+                source_stat = os.fstat(device_fd)
+                if stat.S_ISREG(source_stat.st_mode):
+                    # Re-acquiring an image file: let the kernel copy it
+                    self._copy_regular_file(device_fd, source_stat.st_size)
                 else:
-                    # Try sudo (will prompt in terminal if available)
-                    cmd = ['sudo'] + cmd
-                    self.status.emit("Using sudo (you may be prompted for password in terminal)...")
+                    self._copy_device(device_fd, device_size)
+            finally:
+                os.close(device_fd)
+            return
+        
+        # Note: May require sudo for raw device access
+        cmd_prefix = []
+        if needs_sudo:
+            # Try to use pkexec (GUI sudo prompt) or sudo
+            # Check if pkexec is available (common on Linux desktop)
+            if PKEXEC_PATH:
+                cmd_prefix = ['pkexec']
+                self.status.emit("Using pkexec to request administrator privileges...")
+            elif GKSUDO_PATH:
+                cmd_prefix = ['gksudo']
+                self.status.emit("Using gksudo to request administrator privileges...")
             else:
-                self.status.emit("Starting acquisition...")
-            
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                      stderr=subprocess.STDOUT, 
-                                      universal_newlines=True, bufsize=1)
-            
-            for line in process.stdout:
+                # Try sudo (will prompt in terminal if available)
+                cmd_prefix = ['sudo']
+                self.status.emit("Using sudo (you may be prompted for password in terminal)...")
+        else:
+            self.status.emit("Starting acquisition...")
+        
+        returncode = self._run_dd_and_track(cmd_prefix, device_size)
+        if returncode != 0:
+            error_msg = f"dd command failed with return code {returncode}"
+            # Check if it's a permission error
+            if returncode == 1:
+                error_msg = (
+                    "Acquisition failed: Permission denied.\n\n"
+                    "Raw device access requires root/administrator privileges.\n\n"
+                    "Options:\n"
+                    "1. Run the application with sudo: sudo python3 main.py\n"
+                    "2. Run dd manually in terminal:\n"
+                    f"   sudo dd if={self.device_path} of={self.output_path} bs={self.block_size} status=progress conv=noerror,sync,sparse\n"
+                    "3. Add your user to disk group (Linux):\n"
+                    "   sudo usermod -aG disk $USER\n"
+                    "   (then logout and login again)\n\n"
+                    "Note: Running with sudo is the most secure option for forensic acquisition."
+                )
+            raise Exception(error_msg)
+    
+    def _run_dd_and_track(self, cmd_prefix, device_size):
+        """Run dd for the acquisition, reporting progress until it exits; returns its exit code."""
+        cmd = cmd_prefix + ['dd', f'if={self.device_path}', f'of={self.output_path}', 
+                            f'bs={self.block_size}', 'conv=noerror,sync,sparse']
+        process = start_tool(cmd)
+        
+        # Every dd flavour reports progress differently (if at all), so poll the kernel's read
+        # counter instead, falling back to the output size (through one cached descriptor)
+        # when the device has no counter
+        bytes_read = 0
+        last_progress = 0
+        progress_counter = 0
+        sectors_at_start = self._read_device_sectors()
+        output_fd = None
+        try:
+            while True:
+                try:
+                    process.communicate(timeout=0.25)
+                    break
+                except subprocess.TimeoutExpired:
+                    pass
+                
                 if self.cancelled:
-                    process.terminate()
-                    if os.path.exists(self.output_path):
-                        os.remove(self.output_path)
+                    # Stops dd's whole process group (including a sudo/pkexec wrapper)
+                    stop_tool(process)
+                    process.wait()
                     raise Exception("Acquisition cancelled by user")
                 
-                # Parse dd progress output
-                if 'bytes' in line.lower() or 'copied' in line.lower():
+                sectors = self._read_device_sectors()
+                if sectors is not None and sectors_at_start is not None:
+                    bytes_read = max(bytes_read, (sectors - sectors_at_start) * 512)
+                else:
+                    if output_fd is None:
+                        try:
+                            output_fd = os.open(self.output_path, os.O_RDONLY)
+                        except OSError:
+                            pass  # dd hasn't created it yet
+                    if output_fd is not None:
+                        bytes_read = max(bytes_read, os.fstat(output_fd).st_size)
+                
+                if device_size > 0:
+                    progress = min(int((bytes_read / device_size) * 100), 100)
+                    self.progress.emit(progress)
+                    self.status.emit(f"Acquiring... {self._format_size(bytes_read)} / {self._format_size(device_size)} ({progress}%)")
+                elif bytes_read > 0:
+                    # If we don't know device size, just show bytes read
+                    self.status.emit(f"Acquiring... {self._format_size(bytes_read)}")
+                    # Increment progress slowly to show activity
+                    if bytes_read > last_progress + (10 * 1024 * 1024):  # Every 10MB
+                        last_progress = bytes_read
+                        # Increment progress by 1% up to 99% (will be set to 100% when done)
+                        progress_counter = min(progress_counter + 1, 99)
+                        self.progress.emit(progress_counter)
+        finally:
+            if output_fd is not None:
+                os.close(output_fd)
+        
+        return process.returncode
+    
+    def _copy_regular_file(self, source_fd, file_size):
+        """Copy a regular image file in the kernel with copy_file_range, falling back to sendfile."""
+        # The kernel copy never passes through Python, so hash the source alongside it
+        hash_thread = None
+        hash_result = {}
+        stop = threading.Event()
+        if self.calculate_hash:
+            hash_thread = threading.Thread(target=self._hash_source,
+                                           args=(source_fd, file_size, hash_result, stop), daemon=True)
+            hash_thread.start()
+        
+        copy_file_range = getattr(os, 'copy_file_range', None)
+        copied = 0
+        try:
+            with open(self.output_path, 'wb') as out:
+                output_fd = out.fileno()
+                while True:
+                    if self.cancelled:
+                        raise Exception("Acquisition cancelled by user")
+                    
                     try:
-                        # Extract bytes from dd output (format: "1234567 bytes (1.2 MB, 1.1 MiB) copied")
-                        parts = line.split()
-                        for i, part in enumerate(parts):
-                            if part == 'bytes' and i > 0:
-                                bytes_read = int(parts[i-1].replace(',', ''))
-                                break
-                        
-                        if device_size > 0:
-                            progress = int((bytes_read / device_size) * 100)
-                            self.progress.emit(min(progress, 100))
-                            self.status.emit(f"Acquiring... {self._format_size(bytes_read)} / {self._format_size(device_size)} ({progress}%)")
+                        if copy_file_range:
+                            length = copy_file_range(source_fd, output_fd, KERNEL_COPY_CHUNK,
+                                                     offset_src=copied, offset_dst=copied)
                         else:
-                            # If we don't know device size, just show bytes read
-                            # Estimate progress based on file size growth
-                            if os.path.exists(self.output_path):
-                                file_size = os.path.getsize(self.output_path)
-                                if file_size > bytes_read:
-                                    bytes_read = file_size
-                            
-                            # Show incremental progress
-                            if bytes_read > 0:
-                                # Update progress every 1% of estimated size (if we had one)
-                                # Otherwise just show bytes
-                                self.status.emit(f"Acquiring... {self._format_size(bytes_read)}")
-                                # Increment progress slowly to show activity
-                                if bytes_read > last_progress + (10 * 1024 * 1024):  # Every 10MB
-                                    last_progress = bytes_read
-                                    # Increment progress by 1% up to 99% (will be set to 100% when done)
-                                    progress_counter = min(progress_counter + 1, 99)
-                                    self.progress.emit(progress_counter)
-                    except Exception as e:
-                        # Continue even if parsing fails
-                        self.status.emit(f"Progress: {line.strip()}")
-            
-            process.wait()
-            if process.returncode != 0:
-                error_msg = f"dd command failed with return code {process.returncode}"
-                # Check if it's a permission error
-                if process.returncode == 1:
-                    error_msg = (
-                        "Acquisition failed: Permission denied.\n\n"
-                        "Raw device access requires root/administrator privileges.\n\n"
-                        "Options:\n"
-                        "1. Run the application with sudo: sudo python3 main.py\n"
-                        "2. Run dd manually in terminal:\n"
-                        f"   sudo dd if={self.device_path} of={self.output_path} bs={self.block_size} status=progress conv=noerror,sync\n"
-                        "3. Add your user to disk group (Linux):\n"
-                        "   sudo usermod -aG disk $USER\n"
-                        "   (then logout and login again)\n\n"
-                        "Note: Running with sudo is the most secure option for forensic acquisition."
-                    )
-                raise Exception(error_msg)
-            
-            # Final progress update
-            if os.path.exists(self.output_path):
-                final_size = os.path.getsize(self.output_path)
-                self.status.emit(f"Acquisition complete. Final size: {self._format_size(final_size)}")
-                self.progress.emit(100)
-                
-        except Exception as e:
-            if os.path.exists(self.output_path):
-                os.remove(self.output_path)
+                            length = os.sendfile(output_fd, source_fd, copied, KERNEL_COPY_CHUNK)
+                    except OSError as e:
+                        if copy_file_range and copied == 0 and e.errno in (errno.EXDEV, errno.ENOSYS,
+                                                                           errno.EINVAL, errno.EOPNOTSUPP):
+                            # Not supported between these filesystems or on this kernel
+                            copy_file_range = None
+                            continue
+                        raise
+                    if length == 0:
+                        break
+                    
+                    copied += length
+                    if file_size > 0 and (copied >= file_size or self._should_emit()):
+                        progress = min(int((copied / file_size) * 100), 100)
+                        self.progress.emit(progress)
+                        self.status.emit(f"Acquiring... {self._format_size(copied)} / {self._format_size(file_size)} ({progress}%)")
+        except Exception:
+            stop.set()
             raise
+        finally:
+            if hash_thread:
+                hash_thread.join()
+        
+        if 'error' in hash_result:
+            raise hash_result['error']
+        if 'digests' in hash_result:
+            self.image_hashes = hash_result['digests']
+    
+    def _hash_source(self, source_fd, file_size, result, stop):
+        """Hash an open source file with positional reads, storing the digests in result."""
+        hasher = new_image_hasher()
+        try:
+            # The next block is read into one buffer while the other is still being hashed
+            buffer_size = max(self.block_size, HASH_BLOCK_SIZE)
+            buffers = (bytearray(buffer_size), bytearray(buffer_size))
+            views = tuple(memoryview(buffer) for buffer in buffers)
+            current = 0
+            offset = 0
+            while offset < file_size:
+                if stop.is_set():
+                    return
+                length = os.preadv(source_fd, [buffers[current]], offset)
+                if length == 0:
+                    break
+                hasher.update(views[current][:length])
+                current ^= 1
+                offset += length
+            result['digests'] = hasher.digests()
+        except Exception as e:
+            result['error'] = e
+        finally:
+            hasher.close()
+    
+    def _read_device_sectors(self):
+        """Return the number of sectors read from the device so far, or None if unavailable."""
+        device_name = os.path.basename(self.device_path)
+        try:
+            with open(f"/sys/class/block/{device_name}/stat", 'r') as f:
+                # Third field is sectors read, always in 512-byte units
+                return int(f.read().split()[2])
+        except (OSError, ValueError, IndexError):
+            return None
+    
+    def _copy_device(self, device_fd, device_size):
+        """Copy an open device into the output file, overlapping device reads with image writes."""
+        block_size = self.block_size
+        zero_block = bytes(block_size)
+        free_buffers = queue.Queue()
+        filled_buffers = queue.Queue()
+        for _ in range(COPY_RING_SIZE):
+            free_buffers.put(bytearray(block_size))
+        stop = threading.Event()
+        
+        def reader():
+            offset = 0
+            try:
+                while not stop.is_set():
+                    buffer = free_buffers.get()
+                    try:
+                        length = os.preadv(device_fd, [buffer], offset)
+                    except OSError:
+                        if device_size > 0 and offset >= device_size:
+                            length = 0
+                        else:
+                            # Same as conv=noerror,sync: zero-fill unreadable blocks and move on
+                            buffer[:] = bytes(block_size)
+                            length = block_size
+                            if device_size > 0:
+                                length = min(length, device_size - offset)
+                    if length == 0:
+                        filled_buffers.put(None)
+                        return
+                    offset += length
+                    filled_buffers.put((buffer, length))
+            except Exception as e:
+                filled_buffers.put(e)
+        
+        if HAS_FADVISE:
+            # Ask for aggressive readahead on the one-pass scan of the device
+            os.posix_fadvise(device_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        reader_thread.start()
+        
+        # Hash the blocks as they are copied so the image never has to be read back
+        hasher = new_image_hasher() if self.calculate_hash else None
+        # Buffer still being hashed; it goes back to the reader after the next block is handed over
+        hashing_buffer = None
+        
+        bytes_read = 0
+        last_progress = -1
+        last_reported = 0
+        progress_counter = 0
+        dropped = 0
+        output_dropped = 0
+        try:
+            with open(self.output_path, 'wb') as out:
+                if HAS_FADVISE:
+                    os.posix_fadvise(out.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                while True:
+                    item = filled_buffers.get()
+                    if item is None:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    
+                    buffer, length = item
+                    block = memoryview(buffer)[:length]
+                    if length == block_size and buffer == zero_block:
+                        # Leave a hole for empty blocks instead of writing zeros (like conv=sparse)
+                        out.seek(length, os.SEEK_CUR)
+                    else:
+                        out.write(block)
+                    if hasher:
+                        hasher.update(block)
+                        if hashing_buffer is not None:
+                            free_buffers.put(hashing_buffer)
+                        hashing_buffer = buffer
+                    else:
+                        free_buffers.put(buffer)
+                    bytes_read += length
+                    
+                    if self.cancelled:
+                        raise Exception("Acquisition cancelled by user")
+                    
+                    if HAS_FADVISE and bytes_read - dropped >= DROP_BEHIND_BYTES:
+                        # Neither side is read again, so keep the copy from filling the page cache.
+                        # The output lags one window behind so its pages have had time to be written back.
+                        out.flush()
+                        os.posix_fadvise(device_fd, dropped, bytes_read - dropped, os.POSIX_FADV_DONTNEED)
+                        if dropped > output_dropped:
+                            os.posix_fadvise(out.fileno(), output_dropped, dropped - output_dropped, os.POSIX_FADV_DONTNEED)
+                        output_dropped = dropped
+                        dropped = bytes_read
+                    
+                    if device_size > 0:
+                        progress = min(int((bytes_read / device_size) * 100), 100)
+                        if progress != last_progress and (progress == 100 or self._should_emit()):
+                            last_progress = progress
+                            self.progress.emit(progress)
+                            self.status.emit(f"Acquiring... {self._format_size(bytes_read)} / {self._format_size(device_size)} ({progress}%)")
+                    elif bytes_read >= last_reported + (10 * 1024 * 1024) and self._should_emit():  # Every 10MB
+                        last_reported = bytes_read
+                        progress_counter = min(progress_counter + 1, 99)
+                        self.progress.emit(progress_counter)
+                        self.status.emit(f"Acquiring... {self._format_size(bytes_read)}")
+                
+                # Extend the file over any trailing hole
+                out.truncate(bytes_read)
+                # Make the finished image durable with a single sync at the end
+                out.flush()
+                os.fsync(out.fileno())
+            
+            if hasher:
+                self.image_hashes = hasher.digests()
+        finally:
+            if hasher:
+                hasher.close()
+            stop.set()
+            # Hand the reader a spare buffer in case it is waiting for one
+            free_buffers.put(bytearray(block_size))
+            reader_thread.join()
     
     def _acquire_raw_windows(self, device_size):
         """Acquire raw image on Windows."""
         # Windows requires admin privileges and special tools
         # Using dd for Windows or Win32DiskImager
-        bytes_read = 0
-        
         try:
-            # Try using dd for Windows if available
-            cmd = ['dd', f'if={self.device_path}', f'of={self.output_path}', 
-                   f'bs={self.block_size}', 'status=progress', 'conv=noerror,sync']
-            
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                      stderr=subprocess.STDOUT, 
-                                      universal_newlines=True, bufsize=1)
-            
-            for line in process.stdout:
-                if self.cancelled:
-                    process.terminate()
-                    if os.path.exists(self.output_path):
-                        os.remove(self.output_path)
-                    raise Exception("Acquisition cancelled by user")
-                
-                # Parse progress
-                if 'bytes' in line.lower():
-                    try:
-                        parts = line.split()
-                        for i, part in enumerate(parts):
-                            if part == 'bytes' and i > 0:
-                                bytes_read = int(parts[i-1].replace(',', ''))
-                                break
-                        
-                        progress = int((bytes_read / device_size) * 100) if device_size > 0 else 0
-                        self.progress.emit(min(progress, 100))
-                        self.status.emit(f"Acquiring... {self._format_size(bytes_read)} / {self._format_size(device_size)}")
-                    except:
-                        pass
-            
-            process.wait()
-            if process.returncode != 0:
-                raise Exception(f"Acquisition command failed with return code {process.returncode}")
+            returncode = self._run_dd_and_track([], device_size)
         except FileNotFoundError:
             raise Exception("dd command not found. Please install dd for Windows or use Win32DiskImager.")
-        except Exception as e:
-            if os.path.exists(self.output_path):
-                os.remove(self.output_path)
-            raise
+        if returncode != 0:
+            raise Exception(f"Acquisition command failed with return code {returncode}")
     
     def _acquire_raw_macos(self, device_size):
         """Acquire raw image on macOS using dd."""
-        bytes_read = 0
-        
-        try:
-            cmd = ['dd', f'if={self.device_path}', f'of={self.output_path}', 
-                   f'bs={self.block_size}', 'status=progress', 'conv=noerror,sync']
-            
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                      stderr=subprocess.STDOUT, 
-                                      universal_newlines=True, bufsize=1)
-            
-            for line in process.stdout:
-                if self.cancelled:
-                    process.terminate()
-                    if os.path.exists(self.output_path):
-                        os.remove(self.output_path)
-                    raise Exception("Acquisition cancelled by user")
-                
-                # Parse dd progress
-                if 'bytes' in line.lower():
-                    try:
-                        parts = line.split()
-                        for i, part in enumerate(parts):
-                            if part == 'bytes' and i > 0:
-                                bytes_read = int(parts[i-1].replace(',', ''))
-                                break
-                        
-                        progress = int((bytes_read / device_size) * 100) if device_size > 0 else 0
-                        self.progress.emit(min(progress, 100))
-                        self.status.emit(f"Acquiring... {self._format_size(bytes_read)} / {self._format_size(device_size)}")
-                    except:
-                        pass
-            
-            process.wait()
-            if process.returncode != 0:
-                raise Exception(f"dd command failed with return code {process.returncode}")
-        except Exception as e:
-            if os.path.exists(self.output_path):
-                os.remove(self.output_path)
-            raise
+        returncode = self._run_dd_and_track([], device_size)
+        if returncode != 0:
+            raise Exception(f"dd command failed with return code {returncode}")
+    
+    def _should_emit(self):
+        """Rate-limit progress signals so a fast copy doesn't flood the UI event queue."""
+        now = time.monotonic_ns()
+        if now - self._last_emit_ns < EMIT_INTERVAL_NS:
+            return False
+        self._last_emit_ns = now
+        return True
     
     def _acquire_ewf(self):
         """Acquire disk image in EWF format (.e01) using ewfacquire."""
@@ -304,17 +702,14 @@ class DeviceAcquisitionThread(QThread):
         
         # Ensure parent directory exists
         parent_dir = os.path.dirname(self.output_path)
-        if parent_dir and not os.path.exists(parent_dir):
+        if parent_dir:
             try:
                 os.makedirs(parent_dir, exist_ok=True)
             except Exception as e:
                 raise Exception(f"Failed to create parent directory {parent_dir}: {e}")
         
-        try:
-            # Check if ewfacquire is available
-            subprocess.run(['ewfacquire', '--version'], 
-                          capture_output=True, check=True, timeout=5)
-        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        # Check if ewfacquire is available
+        if not EWFACQUIRE_PATH:
             raise Exception("ewfacquire not found. Please install libewf-tools: sudo apt install libewf-tools")
         
         device_size = self._get_device_size()
@@ -326,74 +721,79 @@ class DeviceAcquisitionThread(QThread):
         self.status.emit(f"Starting EWF acquisition from {self.device_path}...")
         
         # Use ewfacquire to create EWF image
-        cmd = ['ewfacquire', '-t', self.output_path.replace('.e01', ''), 
+        cmd = [EWFACQUIRE_PATH, '-t', self.output_path.replace('.e01', ''), 
                self.device_path]
         
+        process = None
         try:
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                      stderr=subprocess.STDOUT, 
-                                      universal_newlines=True, bufsize=1)
+            process = self.process = start_tool(cmd)
             
-            for line in process.stdout:
+            for line in iter_output_lines(process.stdout):
                 if self.cancelled:
-                    process.terminate()
-                    # Clean up partial EWF files
-                    base_path = self.output_path.replace('.e01', '')
-                    for ext in ['.e01', '.e02', '.e03']:
-                        if os.path.exists(base_path + ext):
-                            os.remove(base_path + ext)
+                    # Partial EWF files are cleaned up below
+                    stop_tool(process)
                     raise Exception("Acquisition cancelled by user")
                 
                 # Parse ewfacquire progress
-                if '%' in line:
+                if b'%' in line:
                     try:
                         # Extract percentage from line like "Progress: 45%"
-                        percent_str = line.split('%')[0].split()[-1]
+                        percent_str = line.split(b'%')[0].split()[-1]
                         progress = int(float(percent_str))
-                        self.progress.emit(progress)
-                        self.status.emit(f"Acquiring EWF image... {progress}%")
+                        if progress >= 100 or self._should_emit():
+                            self.progress.emit(progress)
+                            self.status.emit(f"Acquiring EWF image... {progress}%")
                     except:
                         pass
             
             process.wait()
+            if self.cancelled:
+                raise Exception("Acquisition cancelled by user")
             if process.returncode != 0:
                 raise Exception(f"ewfacquire failed with return code {process.returncode}")
         except Exception as e:
+            if process is not None:
+                # ewfacquire may still be writing segments until it has exited
+                stop_tool(process)
+                process.wait()
             # Clean up partial files
-            base_path = self.output_path.replace('.e01', '')
-            for ext in ['.e01', '.e02', '.e03']:
-                if os.path.exists(base_path + ext):
-                    os.remove(base_path + ext)
+            remove_ewf_segments(self.output_path.replace('.e01', ''))
             raise
     
     def _get_device_size(self):
-        """Get the size of the device in bytes."""
+        """Get the size of the device in bytes, probing the device only once."""
+        if self._device_size_cache is None:
+            self._device_size_cache = self._probe_device_size()
+        return self._device_size_cache
+    
+    def _probe_device_size(self):
+        """Determine the size of the device in bytes."""
         system = platform.system()
         
         try:
             if system == 'Linux':
-                # Method 1: Try blockdev (requires root, but most accurate)
-                try:
-                    result = subprocess.run(['blockdev', '--getsize64', self.device_path],
-                                          capture_output=True, text=True, check=True, timeout=5)
-                    size = result.stdout.strip()
-                    if size and size.isdigit():
-                        return int(size)
-                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                    self.status.emit(f"blockdev failed (may need sudo): {e}")
-                
-                # Method 2: Try reading from /sys/block (no root needed for most info)
+                # Method 1: Try reading from /sys/block (cheap file read, no root needed)
                 try:
                     device_name = os.path.basename(self.device_path)
                     size_file = f"/sys/block/{device_name}/size"
                     if os.path.exists(size_file):
                         with open(size_file, 'r') as f:
+                            # /sys/block always counts 512-byte sectors
                             sectors = int(f.read().strip())
-                            # Sector size is typically 512 bytes
                             return sectors * 512
                 except (ValueError, IOError, OSError) as e:
                     self.status.emit(f"Reading /sys/block failed: {e}")
                 
+                # Method 2: Try blockdev (requires root, but most accurate)
+                try:
+                    result = subprocess.run(['blockdev', '--getsize64', self.device_path],
+                                          capture_output=True, text=True, check=True, timeout=5)
+                    size = result.stdout.strip()
+                    if size and size.isdigit():
+                        return int(size)
+                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
+                    self.status.emit(f"blockdev failed (may need sudo): {e}")
+                
                 # Method 3: Try lsblk to get size
                 try:
                     device_name = os.path.basename(self.device_path)
@@ -441,16 +841,14 @@ class DeviceAcquisitionThread(QThread):
                 try:
                     # Extract disk identifier (e.g., /dev/disk2 -> disk2)
                     disk_id = os.path.basename(self.device_path)
-                    result = subprocess.run(['diskutil', 'info', disk_id],
-                                          capture_output=True, text=True, check=True, timeout=5)
-                    for line in result.stdout.split('\n'):
-                        if 'Disk Size:' in line or 'Total Size:' in line:
-                            # Parse size (format: "Disk Size: 16.0 GB (16000000000 Bytes)")
-                            parts = line.split('(')
-                            if len(parts) > 1:
-                                size_str = parts[1].split()[0]
-                                return int(size_str)
-                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
+                    result = subprocess.run(['diskutil', 'info', '-plist', disk_id],
+                                          capture_output=True, check=True, timeout=5)
+                    info = plistlib.loads(result.stdout)
+                    size = info.get('TotalSize') or info.get('Size')
+                    if size:
+                        return int(size)
+                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired,
+                        plistlib.InvalidFileException) as e:
                     self.status.emit(f"diskutil failed: {e}")
                     
         except Exception as e:
@@ -458,78 +856,130 @@ class DeviceAcquisitionThread(QThread):
         
         return 0
     
+    def _sync_output(self):
+        """Flush the image to disk once and drop it from the page cache before it is hashed."""
+        try:
+            fd = os.open(self.output_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            # Otherwise the hash pass competes with writeback of the freshly written image
+            os.fsync(fd)
+            if HAS_FADVISE:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass  # Some platforms refuse to sync a read-only handle
+        finally:
+            os.close(fd)
+    
     def _calculate_hashes(self):
-        """Calculate MD5, SHA1, and SHA256 hashes of the acquired image."""
+        """Calculate MD5, SHA1, SHA256 (and BLAKE3 if available) hashes of the acquired image."""
         if not os.path.exists(self.output_path):
             return
         
         self.status.emit("Calculating hashes...")
         
-        md5_hash = hashlib.md5()
-        sha1_hash = hashlib.sha1()
-        sha256_hash = hashlib.sha256()
-        
+        hasher = new_image_hasher()
         file_size = os.path.getsize(self.output_path)
-        bytes_read = 0
         
-        with open(self.output_path, 'rb') as f:
-            while True:
-                if self.cancelled:
+        try:
+            if file_size > 0:
+                with open(self.output_path, 'rb') as f:
+                    try:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (OSError, ValueError):
+                        mapped = None  # Some filesystems can't be mapped; read the file instead
+                    
+                    if mapped is None:
+                        completed = hash_chunks(self, hasher, read_file_chunks(f, self.block_size), file_size)
+                    else:
+                        with mapped:
+                            if hasattr(mapped, 'madvise'):
+                                mapped.madvise(mmap.MADV_SEQUENTIAL)
+                            # Slices of the mapping are handed to the hashers without copying
+                            with memoryview(mapped) as view:
+                                try:
+                                    completed = hash_chunks(self, hasher, slice_chunks(view, self.block_size),
+                                                            file_size)
+                                finally:
+                                    # No slice may still be hashing when the mapping is closed
+                                    hasher.close()
+                if not completed:
                     return
-                
-                chunk = f.read(self.block_size)
-                if not chunk:
-                    break
-                
-                md5_hash.update(chunk)
-                sha1_hash.update(chunk)
-                sha256_hash.update(chunk)
-                
-                bytes_read += len(chunk)
-                hash_progress = int((bytes_read / file_size) * 100) if file_size > 0 else 0
-                self.hash_progress.emit(f"Calculating hashes... {hash_progress}%")
-        
-        md5_hex = md5_hash.hexdigest()
-        sha1_hex = sha1_hash.hexdigest()
-        sha256_hex = sha256_hash.hexdigest()
+            
+            self._save_hashes(hasher.digests())
+        finally:
+            hasher.close()
+    
+    def _save_hashes(self, digests):
+        """Write the image hashes (algorithm name -> hex digest) next to the acquired image and report them."""
+        digest_lines = "\n".join(f"{name}: {hex_digest}" for name, hex_digest in digests.items())
         
         # Save hashes to a file
         hash_file = self.output_path + '.hash'
-        with open(hash_file, 'w') as f:
-            f.write(f"MD5: {md5_hex}\n")
-            f.write(f"SHA1: {sha1_hex}\n")
-            f.write(f"SHA256: {sha256_hex}\n")
-            f.write(f"File: {os.path.basename(self.output_path)}\n")
-            f.write(f"Date: {datetime.now().isoformat()}\n")
+        write_hash_file(hash_file, f"{digest_lines}\n"
+                                   f"File: {os.path.basename(self.output_path)}\n"
+                                   f"Date: {datetime.now().isoformat()}\n")
         
         self.status.emit(f"Hashes calculated and saved to {hash_file}")
-        self.hash_progress.emit(f"MD5: {md5_hex}\nSHA1: {sha1_hex}\nSHA256: {sha256_hex}")
+        self.hash_progress.emit(digest_lines)
     
     def _format_size(self, size_bytes):
         """Format size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        return format_size(size_bytes)
 
 
 class DeviceDetector:
     """Detects connected digital devices."""
     
+    # (state key, monotonic time, devices) of the last enumeration
+    _cache = None
+    
     @staticmethod
-    def detect_devices():
-        """Detect all connected storage devices."""
+    def detect_devices(force=False):
+        """Detect all connected storage devices, reusing a recent result if nothing changed.
+        
+        force skips the cache and always enumerates the devices again.
+        """
         system = platform.system()
+        key = DeviceDetector._state_key(system)
+        now = time.monotonic()
+        
+        cache = DeviceDetector._cache
+        if not force and cache and cache[0] == key and now - cache[1] < DEVICE_CACHE_TTL:
+            return list(cache[2])
         
         if system == 'Linux':
-            return DeviceDetector._detect_linux()
+            devices = DeviceDetector._detect_linux()
         elif system == 'Windows':
-            return DeviceDetector._detect_windows()
+            devices = DeviceDetector._detect_windows()
         elif system == 'Darwin':  # macOS
-            return DeviceDetector._detect_macos()
+            devices = DeviceDetector._detect_macos()
         else:
-            return []
+            devices = []
+        
+        DeviceDetector._cache = (key, now, devices)
+        return list(devices)
+    
+    @staticmethod
+    def state_key():
+        """Get a cheap fingerprint of the attached devices, or None if the platform has none."""
+        return DeviceDetector._state_key(platform.system())
+    
+    @staticmethod
+    def _state_key(system):
+        """Get the current block device names, which change when disks are attached or removed.
+        
+        Returns None where there is no cheap listing (Windows); the cache then expires by TTL only.
+        """
+        try:
+            if system == 'Linux':
+                return tuple(sorted(os.listdir('/sys/block')))
+            elif system == 'Darwin':
+                return tuple(sorted(name for name in os.listdir('/dev') if name.startswith('disk')))
+        except OSError:
+            pass
+        return None
     
     @staticmethod
     def _detect_linux():
@@ -563,11 +1013,24 @@ class DeviceDetector:
                             'model': model,
                             'display': f"{name} - {model} ({size})"
                         })
+            
+            # Exact byte sizes from sysfs (tiny files, so a plain loop is cheapest)
+            for device in devices:
+                device['size_bytes'] = DeviceDetector._size_for(device['path'])
         except Exception as e:
             print(f"Error detecting Linux devices: {e}")
         
         return devices
     
+    @staticmethod
+    def _size_for(device_path):
+        """Get a Linux device's size in bytes from /sys/block, or 0 if unavailable."""
+        try:
+            with open(f"/sys/block/{os.path.basename(device_path)}/size", 'r') as f:
+                return int(f.read().strip()) * 512
+        except (OSError, ValueError):
+            return 0
+    
     @staticmethod
     def _detect_windows():
         """Detect devices on Windows using wmic."""
@@ -601,7 +1064,8 @@ class DeviceDetector:
                             'size': f"{size_gb:.2f} GB" if size_gb > 0 else "Unknown",
                             'type': interface,
                             'model': model,
-                            'display': f"PhysicalDrive{index} - {model} ({size_gb:.2f} GB)"
+                            'display': f"PhysicalDrive{index} - {model} ({size_gb:.2f} GB)",
+                            'size_bytes': int(size) if size.isdigit() else 0
                         })
                     except (ValueError, IndexError):
                         continue
@@ -616,44 +1080,30 @@ class DeviceDetector:
         devices = []
         
         try:
-            # Use diskutil to list disks
-            result = subprocess.run(['diskutil', 'list', '-plist'],
-                                  capture_output=True, text=True, check=True)
+            # Use diskutil to list external disks
+            result = subprocess.run(['diskutil', 'list', '-plist', 'external'],
+                                  capture_output=True, check=True)
+            data = plistlib.loads(result.stdout)
             
-            # Parse plist output (simplified - in production, use plistlib)
-            # For now, use diskutil list for simpler parsing
-            result = subprocess.run(['diskutil', 'list'],
-                                  capture_output=True, text=True, check=True)
-            
-            current_disk = None
-            for line in result.stdout.split('\n'):
-                if '/dev/disk' in line and 'external' in line.lower():
-                    # Extract disk identifier
-                    parts = line.split()
-                    for part in parts:
-                        if '/dev/disk' in part:
-                            disk_id = part.split('/')[-1]
-                            current_disk = disk_id
-                            break
-                elif current_disk and ('GB' in line or 'TB' in line or 'MB' in line):
-                    # Extract size
-                    size_parts = line.split()
-                    size = "Unknown"
-                    for part in size_parts:
-                        if 'GB' in part or 'TB' in part or 'MB' in part:
-                            size = part
-                            break
-                    
-                    device_path = f"/dev/{current_disk}"
-                    devices.append({
-                        'path': device_path,
-                        'name': current_disk,
-                        'size': size,
-                        'type': 'disk',
-                        'model': 'External Disk',
-                        'display': f"{current_disk} - External Disk ({size})"
-                    })
-                    current_disk = None
+            for disk in data.get('AllDisksAndPartitions', []):
+                disk_id = disk.get('DeviceIdentifier')
+                if not disk_id:
+                    continue
+                
+                size_bytes = disk.get('Size', 0)
+                # diskutil reports sizes in decimal units
+                size = f"{size_bytes / 1e9:.1f} GB" if size_bytes else "Unknown"
+                
+                device_path = f"/dev/{disk_id}"
+                devices.append({
+                    'path': device_path,
+                    'name': disk_id,
+                    'size': size,
+                    'type': 'disk',
+                    'model': 'External Disk',
+                    'display': f"{disk_id} - External Disk ({size})",
+                    'size_bytes': size_bytes
+                })
         except Exception as e:
             print(f"Error detecting macOS devices: {e}")
         
@@ -663,6 +1113,9 @@ class DeviceDetector:
 class FileAcquisitionDialog(QDialog):
     """Dialog for file acquisition from digital devices."""
     
+    # Posted from the background device scan: (state key, devices)
+    devicesScanned = Signal(object, object)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("File Acquisition - Digital Device")
@@ -671,6 +1124,14 @@ class FileAcquisitionDialog(QDialog):
         self.acquisition_thread = None
         self.devices = []
         
+        # Background polling for attached/removed devices
+        self.poll_interval = DEVICE_POLL_MIN_MS
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setSingleShot(True)
+        self.poll_timer.timeout.connect(self.poll_devices)
+        self.device_key = None
+        self.devicesScanned.connect(self._on_devices_scanned)
+        
         self.init_ui()
         self.refresh_devices()
     
@@ -758,15 +1219,75 @@ class FileAcquisitionDialog(QDialog):
     def refresh_devices(self):
         """Refresh the list of connected devices."""
         self.status_text.append("Scanning for connected devices...")
-        self.devices = DeviceDetector.detect_devices()
+        self.device_key = DeviceDetector.state_key()
+        self._show_devices(DeviceDetector.detect_devices(force=True))
+    
+    def poll_devices(self):
+        """Check for device changes, polling more often right after a change.
+        
+        Only the cheap state key is read here; the devices are enumerated in the
+        background when the key changes, or on every poll where there is no key.
+        """
+        key = DeviceDetector.state_key()
+        if key is not None and key == self.device_key:
+            self.poll_interval = min(self.poll_interval * 2, DEVICE_POLL_MAX_MS)
+            self.poll_timer.start(self.poll_interval)
+            return
+        threading.Thread(target=self._scan_devices, args=(key,), daemon=True).start()
+    
+    def _scan_devices(self, key):
+        """Enumerate the devices off the GUI thread and post the result back."""
+        self.devicesScanned.emit(key, DeviceDetector.detect_devices())
+    
+    def _on_devices_scanned(self, key, devices):
+        """Show the devices from a background scan if they changed, then schedule the next poll."""
+        self.device_key = key
+        if [d['path'] for d in devices] != [d['path'] for d in self.devices]:
+            self.status_text.append("Device change detected")
+            self._show_devices(devices)
+            self.poll_interval = DEVICE_POLL_MIN_MS
+        else:
+            self.poll_interval = min(self.poll_interval * 2, DEVICE_POLL_MAX_MS)
+        if self.isVisible():
+            self.poll_timer.start(self.poll_interval)
+    
+    def showEvent(self, event):
+        """Start polling for devices while the dialog is visible."""
+        super().showEvent(event)
+        self.poll_interval = DEVICE_POLL_MIN_MS
+        self.poll_timer.start(self.poll_interval)
+    
+    def hideEvent(self, event):
+        """Stop polling for devices once the dialog is hidden."""
+        self.poll_timer.stop()
+        super().hideEvent(event)
+    
+    def _show_devices(self, devices):
+        """Fill the device combo box with the given devices, keeping the current selection."""
+        selected = self.device_combo.currentData()
+        self.devices = devices
+        
+        # Build the items in a separate model and install it in one step, so the
+        # combo box updates once instead of once per device
+        model = QStandardItemModel(self.device_combo)
+        selected_row = 0
+        for row, device in enumerate(self.devices):
+            item = QStandardItem(device['display'])
+            item.setData(device, Qt.UserRole)
+            model.appendRow(item)
+            if selected and device['path'] == selected['path']:
+                selected_row = row
+        if not self.devices:
+            model.appendRow(QStandardItem("No devices found"))
+        
+        self.device_combo.blockSignals(True)
+        self.device_combo.setModel(model)
+        self.device_combo.setCurrentIndex(selected_row)
+        self.device_combo.blockSignals(False)
         
-        self.device_combo.clear()
         if self.devices:
-            for device in self.devices:
-                self.device_combo.addItem(device['display'], device)
             self.status_text.append(f"Found {len(self.devices)} device(s)")
         else:
-            self.device_combo.addItem("No devices found")
             self.status_text.append("No devices found. Please connect a digital device.")
     
     def browse_output_path(self):
@@ -828,47 +1349,21 @@ class FileAcquisitionDialog(QDialog):
             QMessageBox.warning(self, "No Output Path", "Please specify an output file path.")
             return
         
-        # Normalize the path
-        output_path = os.path.normpath(output_path)
-        
-        # Expand user path if it starts with ~
-        if output_path.startswith('~'):
-            output_path = os.path.expanduser(output_path)
-        
-        # Resolve relative paths
-        if not os.path.isabs(output_path):
-            output_path = os.path.abspath(output_path)
-        
-        # Check if output path is a directory (before adding extension)
-        if os.path.isdir(output_path):
-            QMessageBox.warning(
-                self, "Invalid Output Path", 
-                f"The specified path is a directory, not a file:\n{output_path}\n\n"
-                f"Please specify a file path (e.g., {output_path}/acquisition.dd)"
-            )
-            return
-        
         # Ensure the output path has the correct extension
         format_index = self.format_combo.currentIndex()
-        if format_index == 0:  # Raw
-            if not output_path.endswith('.dd'):
-                output_path += '.dd'
-        else:  # EWF
-            if not output_path.endswith('.e01'):
-                output_path += '.e01'
+        output_path, output_mode = validate_output_path(output_path, '.dd' if format_index == 0 else '.e01')
         
-        # Check again if output path is a directory (after adding extension)
-        if os.path.isdir(output_path):
+        if output_mode is not None and stat.S_ISDIR(output_mode):
             QMessageBox.warning(
                 self, "Invalid Output Path", 
                 f"The specified path is a directory, not a file:\n{output_path}\n\n"
-                f"Please specify a file path."
+                f"Please specify a file path (e.g., {output_path}/acquisition.dd)"
             )
             return
         
-        # Create parent directory if it doesn't exist
+        # Create parent directory if it doesn't exist; an existing output file implies it does
         parent_dir = os.path.dirname(output_path)
-        if parent_dir and not os.path.exists(parent_dir):
+        if parent_dir and output_mode is None:
             try:
                 os.makedirs(parent_dir, exist_ok=True)
             except Exception as e:
@@ -878,17 +1373,8 @@ class FileAcquisitionDialog(QDialog):
                 )
                 return
         
-        # Final validation: ensure output path is not a directory and parent exists
-        if os.path.isdir(output_path):
-            QMessageBox.warning(
-                self, "Invalid Output Path", 
-                f"The specified path is a directory, not a file:\n{output_path}\n\n"
-                f"Please specify a file path."
-            )
-            return
-        
         # Check if output file already exists
-        if os.path.exists(output_path):
+        if output_mode is not None:
             reply = QMessageBox.question(
                 self, "File Exists", 
                 f"The file {output_path} already exists. Overwrite?",
@@ -933,7 +1419,8 @@ class FileAcquisitionDialog(QDialog):
         # Start acquisition thread
         calculate_hash = self.hash_checkbox.isChecked()
         self.acquisition_thread = DeviceAcquisitionThread(
-            device['path'], output_path, format_type, calculate_hash
+            device['path'], output_path, format_type, calculate_hash,
+            device_size=device.get('size_bytes')
         )
         self.acquisition_thread.progress.connect(self.progress_bar.setValue)
         self.acquisition_thread.status.connect(self.status_text.append)
@@ -977,13 +1464,42 @@ class ImageToE01ConversionThread(QThread):
         super().__init__()
         self.input_path = input_path
         self.output_path = output_path
+        # Output path without the .e01 extension, which ewfacquire adds itself
+        self.base_output_path = output_path[:-4] if output_path.endswith('.e01') else output_path
         self.calculate_hash = calculate_hash
-        self.block_size = block_size
+        self.block_size = max(block_size, MIN_BLOCK_SIZE)
         self.cancelled = False
+        self.process = None
+        # Status lines waiting to be sent to the UI as one batch
+        self._pending_status = []
+        self._last_emit_ns = 0
         
     def cancel(self):
         """Cancel the conversion process."""
         self.cancelled = True
+        # Stop a running ewfacquire now rather than when it next prints a line
+        if self.process is not None:
+            stop_tool(self.process)
+    
+    def _should_emit(self):
+        """Rate-limit progress signals so fast tool output doesn't flood the UI event queue."""
+        now = time.monotonic_ns()
+        if now - self._last_emit_ns < EMIT_INTERVAL_NS:
+            return False
+        self._last_emit_ns = now
+        return True
+    
+    def _queue_status(self, message):
+        """Collect a status line, sending the collected lines in one signal when the rate limit allows."""
+        self._pending_status.append(message)
+        if self._should_emit():
+            self._flush_status()
+    
+    def _flush_status(self):
+        """Send any collected status lines to the UI."""
+        if self._pending_status:
+            self.status.emit('\n'.join(self._pending_status))
+            self._pending_status.clear()
         
     def run(self):
         """Run the conversion process."""
@@ -997,15 +1513,18 @@ class ImageToE01ConversionThread(QThread):
             if not self.cancelled:
                 self.finished.emit(True, f"Conversion completed successfully: {self.output_path}")
         except Exception as e:
+            self._flush_status()
             self.finished.emit(False, f"Conversion failed: {str(e)}")
     
     def _convert_to_e01(self):
         """Convert disk image to E01 format using ewfacquire."""
         # Validate input path
-        if not os.path.exists(self.input_path):
+        try:
+            input_stat = os.stat(self.input_path)
+        except OSError:
             raise Exception(f"Input file does not exist: {self.input_path}")
         
-        if not os.path.isfile(self.input_path):
+        if not stat.S_ISREG(input_stat.st_mode):
             raise Exception(f"Input path is not a file: {self.input_path}")
         
         # Validate output path
@@ -1014,112 +1533,91 @@ class ImageToE01ConversionThread(QThread):
         
         # Ensure parent directory exists
         parent_dir = os.path.dirname(self.output_path)
-        if parent_dir and not os.path.exists(parent_dir):
+        if parent_dir:
             try:
                 os.makedirs(parent_dir, exist_ok=True)
             except Exception as e:
                 raise Exception(f"Failed to create parent directory {parent_dir}: {e}")
         
-        # Check if ewfacquire is available
-        try:
-            subprocess.run(['ewfacquire', '--version'], 
-                          capture_output=True, check=True, timeout=5)
-        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            raise Exception("ewfacquire not found. Please install libewf-tools: sudo apt install libewf-tools")
-        
         # Get input file size
-        input_size = os.path.getsize(self.input_path)
+        input_size = input_stat.st_size
         if input_size == 0:
             raise Exception("Input file is empty")
         
         self.status.emit(f"Input file size: {self._format_size(input_size)}")
         self.status.emit(f"Starting conversion to E01 format...")
         
-        # Prepare output path (remove .e01 extension as ewfacquire adds it)
-        base_output_path = self.output_path
-        if base_output_path.endswith('.e01'):
-            base_output_path = base_output_path[:-4]
+        base_output_path = self.base_output_path
+        
+        # Check if ewfacquire is available
+        if not EWFACQUIRE_PATH:
+            raise Exception("ewfacquire not found. Please install libewf-tools: sudo apt install libewf-tools")
         
         # Use ewfacquire to convert image to EWF format
         # -t: target file (without extension)
         # -f: format (ewf)
         # -c: compression level (best)
-        cmd = ['ewfacquire', '-t', base_output_path, '-f', 'ewf', '-c', 'best', self.input_path]
+        cmd = [EWFACQUIRE_PATH, '-t', base_output_path, '-f', 'ewf', '-c', 'best', self.input_path]
         
+        process = None
         try:
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                      stderr=subprocess.STDOUT, 
-                                      universal_newlines=True, bufsize=1)
+            process = self.process = start_tool(cmd)
             
-            bytes_processed = 0
-            for line in process.stdout:
+            last_pct = -1
+            for line in iter_output_lines(process.stdout):
                 if self.cancelled:
-                    process.terminate()
-                    # Clean up partial EWF files
-                    base_path = base_output_path
-                    for ext in ['.e01', '.e02', '.e03', '.e04', '.e05']:
-                        if os.path.exists(base_path + ext):
-                            os.remove(base_path + ext)
+                    # Partial EWF files are cleaned up below
+                    stop_tool(process)
                     raise Exception("Conversion cancelled by user")
                 
-                # Parse ewfacquire progress
-                if '%' in line:
-                    try:
-                        # Extract percentage from line like "Progress: 45%"
-                        percent_str = line.split('%')[0].split()[-1]
-                        progress = int(float(percent_str))
+                # Parse ewfacquire progress, e.g. "Progress: 45%" or "1234567 bytes copied"
+                match = EWF_PROGRESS_RE.search(line)
+                if not match:
+                    continue
+                
+                percent, bytes_field = match.groups()
+                if percent is not None:
+                    progress = int(float(percent))
+                    # Only signal the UI when the whole percentage changes
+                    if progress != last_pct:
+                        last_pct = progress
                         self.progress.emit(progress)
-                        self.status.emit(f"Converting to E01... {progress}%")
-                    except:
-                        pass
-                elif 'bytes' in line.lower() or 'copied' in line.lower():
-                    # Try to extract bytes processed
-                    try:
-                        parts = line.split()
-                        for i, part in enumerate(parts):
-                            if part == 'bytes' and i > 0:
-                                bytes_processed = int(parts[i-1].replace(',', ''))
-                                if input_size > 0:
-                                    progress = int((bytes_processed / input_size) * 100)
-                                    self.progress.emit(min(progress, 100))
-                                    self.status.emit(f"Converting... {self._format_size(bytes_processed)} / {self._format_size(input_size)} ({progress}%)")
-                                break
-                    except:
-                        pass
+                        self._queue_status(f"Converting to E01... {progress}%")
+                elif input_size > 0:
+                    bytes_processed = int(bytes_field.replace(b',', b''))
+                    progress = int((bytes_processed / input_size) * 100)
+                    if progress != last_pct:
+                        last_pct = progress
+                        self.progress.emit(min(progress, 100))
+                        self._queue_status(f"Converting... {self._format_size(bytes_processed)} / {self._format_size(input_size)} ({progress}%)")
             
             process.wait()
+            if self.cancelled:
+                raise Exception("Conversion cancelled by user")
             if process.returncode != 0:
                 raise Exception(f"ewfacquire failed with return code {process.returncode}")
             
             # Final progress update
+            self._flush_status()
             self.progress.emit(100)
             self.status.emit(f"Conversion complete. Output: {base_output_path}.e01")
             
         except Exception as e:
+            if process is not None:
+                # ewfacquire may still be writing segments until it has exited
+                stop_tool(process)
+                process.wait()
             # Clean up partial files
-            base_path = base_output_path
-            for ext in ['.e01', '.e02', '.e03', '.e04', '.e05']:
-                if os.path.exists(base_path + ext):
-                    os.remove(base_path + ext)
+            remove_ewf_segments(base_output_path)
             raise
     
     def _calculate_hashes(self):
         """Calculate MD5, SHA1, and SHA256 hashes of the converted image."""
         # For E01 files, we need to check all segments
-        base_path = self.output_path
-        if base_path.endswith('.e01'):
-            base_path = base_path[:-4]
+        base_path = self.base_output_path
         
         # Find all E01 segments
-        e01_files = []
-        segment_num = 1
-        while True:
-            segment_path = f"{base_path}.e{segment_num:02d}"
-            if os.path.exists(segment_path):
-                e01_files.append(segment_path)
-                segment_num += 1
-            else:
-                break
+        e01_files = find_ewf_segments(base_path)
         
         if not e01_files:
             # Fallback to original output path
@@ -1131,54 +1629,51 @@ class ImageToE01ConversionThread(QThread):
         
         self.status.emit("Calculating hashes...")
         
-        md5_hash = hashlib.md5()
-        sha1_hash = hashlib.sha1()
-        sha256_hash = hashlib.sha256()
-        
-        total_size = sum(os.path.getsize(f) for f in e01_files)
-        bytes_read = 0
-        
-        for e01_file in e01_files:
-            with open(e01_file, 'rb') as f:
-                while True:
-                    if self.cancelled:
-                        return
-                    
-                    chunk = f.read(self.block_size)
-                    if not chunk:
-                        break
-                    
-                    md5_hash.update(chunk)
-                    sha1_hash.update(chunk)
-                    sha256_hash.update(chunk)
-                    
-                    bytes_read += len(chunk)
-                    hash_progress = int((bytes_read / total_size) * 100) if total_size > 0 else 0
-                    self.hash_progress.emit(f"Calculating hashes... {hash_progress}%")
+        # Never zero, so the progress division needs no check
+        total_size = max(sum(os.path.getsize(f) for f in e01_files), 1)
+        buffer_size = max(self.block_size, HASH_BLOCK_SIZE)
+        
+        def segment_chunks():
+            for e01_file in e01_files:
+                with open(e01_file, 'rb') as f:
+                    if HAS_FADVISE:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    yield from read_file_chunks(f, buffer_size)
+                    if HAS_FADVISE:
+                        # The segment isn't read again, so don't let it crowd out other cached data
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        
+        # MD5, SHA1 and SHA256 of the segment files, each on its own thread
+        hasher = FusedHasher()
+        try:
+            if not hash_chunks(self, hasher, segment_chunks(), total_size):
+                return
+            self._save_hashes(hasher.digests())
+        finally:
+            hasher.close()
+    
+    def _save_hashes(self, digests):
+        """Write the MD5, SHA1 and SHA256 digests next to the E01 and report them."""
+        base_path = self.base_output_path
         
-        md5_hex = md5_hash.hexdigest()
-        sha1_hex = sha1_hash.hexdigest()
-        sha256_hex = sha256_hash.hexdigest()
+        md5_hex = digests['MD5']
+        sha1_hex = digests['SHA1']
+        sha256_hex = digests['SHA256']
         
         # Save hashes to a file
         hash_file = base_path + '.hash'
-        with open(hash_file, 'w') as f:
-            f.write(f"MD5: {md5_hex}\n")
-            f.write(f"SHA1: {sha1_hex}\n")
-            f.write(f"SHA256: {sha256_hex}\n")
-            f.write(f"File: {os.path.basename(base_path)}.e01\n")
-            f.write(f"Date: {datetime.now().isoformat()}\n")
+        write_hash_file(hash_file, f"MD5: {md5_hex}\n"
+                                   f"SHA1: {sha1_hex}\n"
+                                   f"SHA256: {sha256_hex}\n"
+                                   f"File: {os.path.basename(base_path)}.e01\n"
+                                   f"Date: {datetime.now().isoformat()}\n")
         
         self.status.emit(f"Hashes calculated and saved to {hash_file}")
         self.hash_progress.emit(f"MD5: {md5_hex}\nSHA1: {sha1_hex}\nSHA256: {sha256_hex}")
     
     def _format_size(self, size_bytes):
         """Format size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        return format_size(size_bytes)
 
 
 class ImageToE01ConversionDialog(QDialog):
@@ -1308,11 +1803,13 @@ class ImageToE01ConversionDialog(QDialog):
             QMessageBox.warning(self, "No Input File", "Please select an input disk image file.")
             return
         
-        if not os.path.exists(input_path):
+        try:
+            input_stat = os.stat(input_path)
+        except OSError:
             QMessageBox.warning(self, "File Not Found", f"The input file does not exist:\n{input_path}")
             return
         
-        if not os.path.isfile(input_path):
+        if not stat.S_ISREG(input_stat.st_mode):
             QMessageBox.warning(self, "Invalid Input", f"The input path is not a file:\n{input_path}")
             return
         
@@ -1321,19 +1818,10 @@ class ImageToE01ConversionDialog(QDialog):
             QMessageBox.warning(self, "No Output Path", "Please specify an output file path.")
             return
         
-        # Normalize the path
-        output_path = os.path.normpath(output_path)
-        
-        # Expand user path if it starts with ~
-        if output_path.startswith('~'):
-            output_path = os.path.expanduser(output_path)
-        
-        # Resolve relative paths
-        if not os.path.isabs(output_path):
-            output_path = os.path.abspath(output_path)
+        # Ensure the output path has .e01 extension
+        output_path, output_mode = validate_output_path(output_path, '.e01')
         
-        # Check if output path is a directory
-        if os.path.isdir(output_path):
+        if output_mode is not None and stat.S_ISDIR(output_mode):
             QMessageBox.warning(
                 self, "Invalid Output Path", 
                 f"The specified path is a directory, not a file:\n{output_path}\n\n"
@@ -1341,13 +1829,9 @@ class ImageToE01ConversionDialog(QDialog):
             )
             return
         
-        # Ensure the output path has .e01 extension
-        if not output_path.endswith('.e01'):
-            output_path += '.e01'
-        
-        # Create parent directory if it doesn't exist
+        # Create parent directory if it doesn't exist; an existing output file implies it does
         parent_dir = os.path.dirname(output_path)
-        if parent_dir and not os.path.exists(parent_dir):
+        if parent_dir and output_mode is None:
             try:
                 os.makedirs(parent_dir, exist_ok=True)
             except Exception as e:
@@ -1358,11 +1842,10 @@ class ImageToE01ConversionDialog(QDialog):
                 return
         
         # Check if output file already exists
-        base_output_path = output_path[:-4] if output_path.endswith('.e01') else output_path
-        if os.path.exists(base_output_path + '.e01'):
+        if output_mode is not None:
             reply = QMessageBox.question(
                 self, "File Exists", 
-                f"The file {base_output_path}.e01 already exists. Overwrite?",
+                f"The file {output_path} already exists. Overwrite?",
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.No:
@@ -1372,7 +1855,7 @@ class ImageToE01ConversionDialog(QDialog):
         self.output_path_edit.setText(output_path)
         
         # Get input file size for confirmation
-        input_size = os.path.getsize(input_path)
+        input_size = input_stat.st_size
         input_size_str = self._format_size(input_size)
         
         # Confirm before starting
@@ -1432,9 +1915,5 @@ class ImageToE01ConversionDialog(QDialog):
     
     def _format_size(self, size_bytes):
         """Format size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        return format_size(size_bytes)
 
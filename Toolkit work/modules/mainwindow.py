@@ -2,18 +2,21 @@ import configparser
 import hashlib
 import os
 import zipfile
-import io
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 
-from PySide6.QtCore import Qt, QSize, QThread, Signal
+from PySide6.QtCore import (Qt, QSize, QThread, QTimer, Signal, QAbstractTableModel, QAbstractItemModel, QModelIndex,
+                            QPersistentModelIndex, QSortFilterProxyModel)
 from PySide6.QtGui import QIcon, QFont, QPalette, QBrush, QAction, QActionGroup
-from PySide6.QtWidgets import (QMainWindow, QMenuBar, QMenu, QToolBar, QDockWidget, QTreeWidget, QTabWidget,
-                               QFileDialog, QTreeWidgetItem, QTableWidget, QMessageBox, QTableWidgetItem,
+from PySide6.QtWidgets import (QMainWindow, QMenuBar, QMenu, QToolBar, QDockWidget, QTreeView, QTabWidget,
+                               QFileDialog, QTableWidget, QMessageBox, QTableWidgetItem,
                                QDialog, QVBoxLayout, QInputDialog, QDialogButtonBox, QHeaderView, QLabel, QLineEdit,
-                               QFormLayout, QApplication)
+                               QFormLayout, QApplication, QTableView, QWidget)
 
 from managers.database_manager import DatabaseManager
-from managers.evidence_utils import ImageHandler
+from managers.evidence_utils import ImageHandler, LRUCache
 from managers.image_manager import ImageManager
 from modules.about import AboutDialog
 from modules.converter import Main
@@ -32,9 +35,319 @@ from modules.file_acquisition import FileAcquisitionDialog, ImageToE01Conversion
 from modules.mind_map import MindMapWidget
 
 SECTOR_SIZE = 512
+CONFIG_FILE = 'config.ini'
+THEMES = ('light', 'dark')
+
+# Supported image file extensions, including both lowercase and uppercase variants
+SUPPORTED_IMAGE_EXTENSIONS = ("*.e01", "*.E01", "*.s01", "*.S01",
+                              "*.l01", "*.L01", "*.raw", "*.RAW",
+                              "*.img", "*.IMG", "*.dd", "*.DD",
+                              "*.iso", "*.ISO", "*.ad1", "*.AD1",
+                              "*.001", "*.ex01", "*.dmg",
+                              "*.sparse", "*.sparseimage")
+IMAGE_FILE_FILTER = "Supported Image Files ({})".format(" ".join(SUPPORTED_IMAGE_EXTENSIONS))
+
+# Parsed config files keyed by path, as (mtime_ns, parser); reparsed only when the file changes
+_CONFIG_CACHE = {}
+# Distinct icon files kept as shared QIcons; a listing only ever uses a few dozen
+ICON_CACHE_SIZE = 256
+
+# Role used by the listing table's sort proxy to compare raw values instead of display text
+SORT_ROLE = Qt.UserRole + 1
+
+# Names treated as ZIP archives in the tree (Office documents and Java/Android packages are ZIPs too)
+ZIP_EXTENSIONS = ('.zip', '.jar', '.war', '.ear', '.apk', '.docx', '.xlsx', '.pptx')
+# Local file header and end-of-central-directory (empty archive) signatures
+ZIP_SIGNATURES = (b'PK\x03\x04', b'PK\x05\x06')
+ZIP_CACHE_SIZE = 32  # Max parsed ZIP central directories kept in memory
+
+# Shown under a tree item while its children are read in the background
+LOADING_TEXT = "Loading..."
+
+# Delay before rendering the selected file in a newly activated viewer tab
+TAB_SWITCH_DELAY_MS = 80
+
+# Initial (and minimum) size of the viewer dock
+VIEWER_DOCK_SIZE = QSize(1200, 222)
+
+# Header resize mode for each listing column, in ListingTableModel.HEADERS order
+LISTING_COLUMN_RESIZE_MODES = (QHeaderView.Stretch, QHeaderView.ResizeToContents, QHeaderView.ResizeToContents,
+                               QHeaderView.ResizeToContents, QHeaderView.Stretch, QHeaderView.Stretch,
+                               QHeaderView.Stretch, QHeaderView.Stretch)
+
+
+@dataclass(slots=True)
+class PartitionInfo:
+    """A partition found by the background loader; the filesystem type is checked later."""
+    addr: int
+    desc: str
+    start: int
+    end: int
+    length: int
+    readable_size: str
+
+
+@dataclass(slots=True)
+class PartitionLoadResult:
+    """What the background partition loader hands back to the GUI thread."""
+    has_partitions: bool = False
+    has_filesystem: bool = False
+    partitions: list = field(default_factory=list)
+    error: str = None
+    traceback: str = None
+
+
+def _load_stylesheets():
+    """Read the theme stylesheets; they are small and static, so switching themes never touches the disk."""
+    stylesheets = {}
+    for theme in THEMES:
+        qss_file = f'styles/{theme}_theme.qss'
+        try:
+            with open(qss_file, 'r') as f:
+                stylesheets[theme] = f.read()
+        except OSError as e:
+            print(f"Error loading stylesheet {qss_file}: {e}")
+    return stylesheets
+
+
+STYLESHEETS = _load_stylesheets()
+
+
+def _load_config(path):
+    """Return the parsed config file, reusing the cached parser while the file is unchanged."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return configparser.ConfigParser()  # No config saved yet
+    entry = _CONFIG_CACHE.get(path)
+    if entry and entry[0] == mtime:
+        return entry[1]
+    config = configparser.ConfigParser()
+    config.read(path)
+    _CONFIG_CACHE[path] = (mtime, config)
+    return config
+
+
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def icon_for_path(icon_path):
+    """Return a QIcon for icon_path, shared by every tree and listing row that uses it."""
+    return QIcon(icon_path)
+
+
+def file_icon_key(name):
+    """Return the lower-case extension used to look up a file's icon, or 'unknown'."""
+    _, dot, extension = name.rpartition('.')
+    return extension.lower() if dot else 'unknown'
+
+
+class ListingTableModel(QAbstractTableModel):
+    """Table model for the directory listing; cells are only rendered when the view asks for them."""
+
+    HEADERS = ['Name', 'Inode', 'Type', 'Size', 'Created Date', 'Accessed Date', 'Modified Date', 'Changed Date']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Each row is (name, inode, type, size, created, accessed, modified, changed, size_in_bytes, icon_path, data)
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Replace the whole listing in one model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def clear(self):
+        self.set_rows([])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            return row[0] if column == 0 else str(row[column])
+        if role == SORT_ROLE:
+            if column == 1:
+                return row[1] if isinstance(row[1], int) else -1
+            if column == 3:
+                return row[8]
+            return row[0] if column == 0 else str(row[column])
+        if column == 0:
+            if role == Qt.DecorationRole:
+                return icon_for_path(row[9])
+            if role == Qt.UserRole:
+                return row[10]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class TreeNode:
+    """A row of the evidence tree."""
+
+    __slots__ = ('text', 'icon_path', 'data', 'parent', 'row', 'children', 'children_loaded')
+
+    def __init__(self, text, icon_path, data, lazy=False):
+        self.text = text
+        self.icon_path = icon_path
+        self.data = data
+        self.parent = None
+        self.row = 0
+        self.children = []
+        # Lazy nodes show an expand arrow and load their children the first time they are expanded
+        self.children_loaded = not lazy
+
+
+class EvidenceTreeModel(QAbstractItemModel):
+    """Tree model for the evidence view; only nodes that have been expanded hold children."""
+
+    def __init__(self, fetch_children, parent=None):
+        super().__init__(parent)
+        self._root = TreeNode(None, None, None)
+        # Called with the index of a lazy node when the view wants its children
+        self._fetch_children = fetch_children
+
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    def add_nodes(self, parent_index, nodes):
+        """Append child nodes under parent_index with a single row insertion."""
+        if not nodes:
+            return
+        parent_node = self.node(parent_index)
+        first = len(parent_node.children)
+        self.beginInsertRows(parent_index, first, first + len(nodes) - 1)
+        for row, node in enumerate(nodes, first):
+            node.parent = parent_node
+            node.row = row
+        parent_node.children.extend(nodes)
+        self.endInsertRows()
+
+    def add_node(self, parent_index, text, icon_path, data, lazy=False):
+        """Append one child node and return its index."""
+        self.add_nodes(parent_index, [TreeNode(text, icon_path, data, lazy)])
+        return self.index(len(self.node(parent_index).children) - 1, 0, parent_index)
+
+    def set_children(self, parent_index, nodes):
+        """Replace the children of parent_index (e.g. a loading placeholder) with nodes."""
+        parent_node = self.node(parent_index)
+        if parent_node.children:
+            self.beginRemoveRows(parent_index, 0, len(parent_node.children) - 1)
+            parent_node.children = []
+            self.endRemoveRows()
+        if nodes:
+            self.add_nodes(parent_index, nodes)
+        else:
+            # Nothing was found, so let the view drop the expand arrow
+            self.dataChanged.emit(parent_index, parent_index)
+
+    def mark_as_zip(self, index):
+        """Turn a file node into an expandable ZIP node and return its updated data."""
+        node = self.node(index)
+        node.data["type"] = 'zip'
+        node.data["is_zip"] = True
+        node.children_loaded = False
+        self.dataChanged.emit(index, index)
+        return node.data
+
+    def set_text(self, index, text):
+        self.node(index).text = text
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def remove_top_level(self, index):
+        """Remove the top-level node at index."""
+        if not index.isValid() or index.parent().isValid():
+            return
+        row = index.row()
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._root.children[row]
+        for sibling in self._root.children[row:]:
+            sibling.row -= 1
+        self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._root.children = []
+        self.endResetModel()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self.node(parent).children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        return bool(node.children) or not node.children_loaded
+
+    def canFetchMore(self, parent):
+        return parent.isValid() and not self.node(parent).children_loaded
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        node.children_loaded = True
+        self._fetch_children(parent)
+        if not node.children:
+            # Nothing was found, so let the view drop the expand arrow
+            self.dataChanged.emit(parent, parent)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.text
+        if role == Qt.DecorationRole:
+            return icon_for_path(node.icon_path)
+        if role == Qt.UserRole:
+            return node.data
+        return None
+
+
+class ViewerDock(QDockWidget):
+    """Dock for the viewer tabs that asks for its initial size through sizeHint."""
+
+    def sizeHint(self):
+        return VIEWER_DOCK_SIZE
 
 
 class MainWindow(QMainWindow):
+    # Emitted from the background loader with (result, root index, drive icon, unknown icon)
+    partitionsLoaded = Signal(object, object, str, str)
+    # Emitted from the background loader with (parent index, child nodes, new parent text or None)
+    childrenLoaded = Signal(object, object, object)
+    # Emitted from the background loader with [(partition, OS version, file system type), ...]
+    osInformationLoaded = Signal(object)
+    # Emitted from the background loader with (ZIP cache key, parsed listing)
+    zipListingLoaded = Signal(object, object)
+    # Emitted from the background hasher with (file content, MD5 hex digest)
+    fileHashed = Signal(object, str)
+
     def __init__(self):
         super().__init__()
 
@@ -47,19 +360,31 @@ class MainWindow(QMainWindow):
         self.db_manager = DatabaseManager('tools/new_database_mappings.db')
         self.current_selected_data = None
 
-        self.evidence_files = []
+        # Loaded image paths mapped to the persistent index of their root item in the tree
+        self.evidence_files = {}
+
+        # Parsed ZIP listings (entries, entries by directory) keyed by (image path, inode, partition offset)
+        self.zip_contents_cache = LRUCache(ZIP_CACHE_SIZE)
+
+        # Tool windows, created when first opened
+        self.veriphone_widget = None
+        self.verification_widget = None
 
-        self.image_manager.operationCompleted.connect(
-            lambda success, message: (
-                QMessageBox.information(self, "Image Operation", message) if success else QMessageBox.critical(self,
-                                                                                                               "Image "
-                                                                                                               "Operation",
-                                                                                                               message),
-                setattr(self, "image_mounted", not self.image_mounted) if success else None)[1])
+        self.image_manager.operationCompleted.connect(self.on_image_operation_completed)
 
         # # Load existing API keys
-        self.api_keys = configparser.ConfigParser()
-        self.api_keys.read('config.ini')
+        self.api_keys = _load_config(CONFIG_FILE)
+
+        # The stylesheet currently installed on the application
+        self._current_qss = None
+
+        # Shared pool for background loading, shut down when the window closes
+        self._bg_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="trace-bg")
+        self.partitionsLoaded.connect(self._on_partitions_loaded)
+        self.childrenLoaded.connect(self._on_children_loaded)
+        self.osInformationLoaded.connect(self.show_os_information)
+        self.fileHashed.connect(self._on_file_hashed)
+        self.zipListingLoaded.connect(self._on_zip_listing_loaded)
 
         self.initialize_ui()
 
@@ -75,20 +400,18 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
 
         menu_bar = QMenuBar(self)
-        file_actions = {
-            'Add Evidence File': self.load_image_evidence,
-            'Remove Evidence File': self.remove_image_evidence,
-            'separator': None,  # This will add a separator
-            'File Acquisition': self.open_file_acquisition,
-            'Convert to E01': self.open_convert_to_e01,
-            'separator2': None,  # This will add a separator
-            'Image Mounting': self.image_manager.mount_image,
-            'Image Unmounting': self.image_manager.dismount_image,
-            'separator3': None,  # This will add a separator
-            'Exit': self.close
-        }
-
-        self.create_menu(menu_bar, 'File', file_actions)
+        file_menu = self.create_menu('File', [
+            ('Add Evidence File', self.load_image_evidence),
+            ('Remove Evidence File', self.remove_image_evidence),
+            (None, None),  # This will add a separator
+            ('File Acquisition', self.open_file_acquisition),
+            ('Convert to E01', self.open_convert_to_e01),
+            (None, None),
+            ('Image Mounting', self.image_manager.mount_image),
+            ('Image Unmounting', self.image_manager.dismount_image),
+            (None, None),
+            ('Exit', self.close),
+        ])
 
         view_menu = QMenu('View', self)
 
@@ -125,40 +448,24 @@ class MainWindow(QMainWindow):
         theme_group.addAction(dark_theme_action)
         view_menu.addAction(dark_theme_action)
 
-        # Add the view menu to the menu bar
-        menu_bar.addMenu(view_menu)
-
         # **Apply the default stylesheet**
         self.apply_stylesheet('light')
 
-        tools_menu = QMenu('Tools', self)
-
-        verify_image_action = QAction("Verify Image", self)
-        verify_image_action.triggered.connect(self.verify_image)
-        tools_menu.addAction(verify_image_action)
-
-        conversion_action = QAction("Convert E01 to DD/RAW", self)
-        conversion_action.triggered.connect(self.show_conversion_widget)
-        tools_menu.addAction(conversion_action)
-
-        veriphone_api_action = QAction("Veriphone API", self)
-        veriphone_api_action.triggered.connect(self.show_veriphone_widget)
-        tools_menu.addAction(veriphone_api_action)
+        tools_menu = self.create_menu('Tools', [
+            ("Verify Image", self.verify_image),
+            ("Convert E01 to DD/RAW", self.show_conversion_widget),
+            ("Veriphone API", self.show_veriphone_widget),
+        ])
 
         help_menu = QMenu('Help', self)
         help_menu.addAction("About")
         help_menu.triggered.connect(lambda: AboutDialog(self).exec_())
 
         # Add "Options" menu for API key configuration
-        options_menu = QMenu('Options', self)
-        api_key_action = QAction("API Keys", self)
-        api_key_action.triggered.connect(self.show_api_key_dialog)
-        options_menu.addAction(api_key_action)
+        options_menu = self.create_menu('Options', [("API Keys", self.show_api_key_dialog)])
 
-        menu_bar.addMenu(view_menu)
-        menu_bar.addMenu(tools_menu)
-        menu_bar.addMenu(help_menu)
-        menu_bar.addMenu(options_menu)
+        for menu in (file_menu, view_menu, tools_menu, help_menu, options_menu):
+            menu_bar.addMenu(menu)
 
         self.setMenuBar(menu_bar)
 
@@ -199,11 +506,13 @@ class MainWindow(QMainWindow):
 
         self.addToolBar(Qt.TopToolBarArea, self.main_toolbar)
 
-        self.tree_viewer = QTreeWidget(self)
+        # Children are loaded by the model when a node is first expanded
+        self.tree_model = EvidenceTreeModel(self.on_item_expanded, self)
+        self.tree_viewer = QTreeView(self)
+        self.tree_viewer.setModel(self.tree_model)
         self.tree_viewer.setIconSize(QSize(16, 16))
         self.tree_viewer.setHeaderHidden(True)
-        self.tree_viewer.itemExpanded.connect(self.on_item_expanded)
-        self.tree_viewer.itemClicked.connect(self.on_item_clicked)
+        self.tree_viewer.clicked.connect(self.on_item_clicked)
         self.tree_viewer.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree_viewer.customContextMenuRequested.connect(self.open_tree_context_menu)
 
@@ -215,111 +524,137 @@ class MainWindow(QMainWindow):
         self.result_viewer = QTabWidget(self)
         self.setCentralWidget(self.result_viewer)
 
-        self.listing_table = QTableWidget()
+        # The listing is a view over a model, so only the visible cells are ever materialized
+        self.listing_model = ListingTableModel(self)
+        self.listing_proxy = QSortFilterProxyModel(self)
+        self.listing_proxy.setSourceModel(self.listing_model)
+        self.listing_proxy.setSortRole(SORT_ROLE)
+
+        self.listing_table = QTableView()
+        self.listing_table.setModel(self.listing_proxy)
         self.listing_table.setSortingEnabled(True)
         self.listing_table.verticalHeader().setVisible(False)
 
         # Use alternate row colors
         self.listing_table.setAlternatingRowColors(True)
-        self.listing_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.listing_table.setEditTriggers(QTableView.NoEditTriggers)
         self.listing_table.setIconSize(QSize(24, 24))
-        self.listing_table.setColumnCount(8)
 
-        # Set the horizontal header with dynamic resizing
+        # Set the horizontal header with dynamic resizing: the name and date columns stretch,
+        # while inode, type and size resize based on content
         header = self.listing_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Stretch)  # Name column stretches dynamically
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Inode column resizes based on content
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Type column resizes based on content
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Size column resizes based on content
-        header.setSectionResizeMode(4, QHeaderView.Stretch)  # Created Date column stretches dynamically
-        header.setSectionResizeMode(5, QHeaderView.Stretch)  # Accessed Date column stretches dynamically
-        header.setSectionResizeMode(6, QHeaderView.Stretch)  # Modified Date column stretches dynamically
-        header.setSectionResizeMode(7, QHeaderView.Stretch)  # Changed Date column stretches dynamically
-
-        # Set the header labels
-        self.listing_table.setHorizontalHeaderLabels(
-            ['Name', 'Inode', 'Type', 'Size', 'Created Date', 'Accessed Date', 'Modified Date', 'Changed Date']
-        )
-
-        self.listing_table.itemDoubleClicked.connect(self.on_listing_table_item_clicked)
+        for column, mode in enumerate(LISTING_COLUMN_RESIZE_MODES):
+            header.setSectionResizeMode(column, mode)
+        header.setDefaultAlignment(Qt.AlignLeft)
+
+        self.listing_table.doubleClicked.connect(self.on_listing_table_item_clicked)
         self.listing_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.listing_table.customContextMenuRequested.connect(self.open_listing_context_menu)
-        self.listing_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.listing_table.setSelectionBehavior(QTableView.SelectRows)
 
         # Set the color of the selected row
         palette = self.listing_table.palette()
         palette.setBrush(QPalette.Highlight, QBrush(Qt.lightGray))  # Change Qt.lightGray to your preferred color
         self.listing_table.setPalette(palette)
 
-        header = self.listing_table.horizontalHeader()
-        header.setDefaultAlignment(Qt.AlignLeft)
-
         self.result_viewer.addTab(self.listing_table, 'Listing')
 
-        self.deleted_files_widget = FileCarvingWidget(self)
-        self.result_viewer.addTab(self.deleted_files_widget, 'Deleted Files')
+        self.create_context_menus()
+
+        # Every tab except the first of each tab widget starts as a placeholder and the real
+        # widget is built the first time the tab is shown; until then its attribute is None
+        self._tab_factories = {}
 
-        self.registry_extractor_widget = RegistryExtractor(self.image_handler)
-        self.result_viewer.addTab(self.registry_extractor_widget, 'Registry')
+        self.add_lazy_tab(self.result_viewer, 'Deleted Files', 'deleted_files_widget', self.create_deleted_files_widget)
+        self.add_lazy_tab(self.result_viewer, 'Registry', 'registry_extractor_widget',
+                          lambda: RegistryExtractor(self.image_handler))
 
         # #add tab for displaying all files chosen by user
-        self.file_search_widget = FileSearchWidget(self.image_handler)
-        self.result_viewer.addTab(self.file_search_widget, 'File Search')
+        self.add_lazy_tab(self.result_viewer, 'File Search', 'file_search_widget',
+                          lambda: FileSearchWidget(self.image_handler))
+        self.result_viewer.currentChanged.connect(lambda index: self.materialize_tab(self.result_viewer, index))
 
         self.viewer_tab = QTabWidget(self)
 
         self.hex_viewer = HexViewer(self)
         self.viewer_tab.addTab(self.hex_viewer, 'Hex')
 
-        self.text_viewer = TextViewer(self)
-        self.viewer_tab.addTab(self.text_viewer, 'Text')
-
-        self.application_viewer = UnifiedViewer(self)
-        self.application_viewer.layout.setContentsMargins(0, 0, 0, 0)
-        self.application_viewer.layout.setSpacing(0)
-        self.viewer_tab.addTab(self.application_viewer, 'Application')
-
-        self.metadata_viewer = MetadataViewer(self.image_handler)
-        self.viewer_tab.addTab(self.metadata_viewer, 'File Metadata')
-
-        self.exif_viewer = ExifViewer(self)
-        self.viewer_tab.addTab(self.exif_viewer, 'Exif Data')
-
-        self.virus_total_api = VirusTotal()
-        self.viewer_tab.addTab(self.virus_total_api, 'Virus Total API')
-
-        # Set the API key if it exists
-        virus_total_key = self.api_keys.get('API_KEYS', 'virustotal', fallback='')
-        self.virus_total_api.set_api_key(virus_total_key)
+        self.add_lazy_tab(self.viewer_tab, 'Text', 'text_viewer', lambda: TextViewer(self))
+        self.add_lazy_tab(self.viewer_tab, 'Application', 'application_viewer', self.create_application_viewer)
+        self.add_lazy_tab(self.viewer_tab, 'File Metadata', 'metadata_viewer',
+                          lambda: MetadataViewer(self.image_handler))
+        self.add_lazy_tab(self.viewer_tab, 'Exif Data', 'exif_viewer', lambda: ExifViewer(self))
+        self.add_lazy_tab(self.viewer_tab, 'Virus Total API', 'virus_total_api', self.create_virus_total_widget)
 
         # Mind Map tab
-        self.mind_map_widget = MindMapWidget(self.image_handler, self)
-        self.viewer_tab.addTab(self.mind_map_widget, 'Mind Map')
+        self.add_lazy_tab(self.viewer_tab, 'Mind Map', 'mind_map_widget',
+                          lambda: MindMapWidget(self.image_handler, self))
 
-        self.viewer_dock = QDockWidget('Utils', self)
+        self.viewer_dock = ViewerDock('Utils', self)
         self.viewer_dock.setWidget(self.viewer_tab)
+        self.viewer_dock.setMinimumSize(VIEWER_DOCK_SIZE)
         self.addDockWidget(Qt.BottomDockWidgetArea, self.viewer_dock)
-
-        self.viewer_dock.setMinimumSize(1200, 222)
-        self.viewer_dock.setMaximumSize(1200, 222)
-        self.viewer_dock.visibilityChanged.connect(self.on_viewer_dock_focus)
-        self.viewer_tab.currentChanged.connect(self.display_content_for_active_tab)
+        # Rapid tab switches are coalesced so only the tab the user settles on is rendered
+        self.tab_switch_timer = QTimer(self)
+        self.tab_switch_timer.setSingleShot(True)
+        self.tab_switch_timer.setInterval(TAB_SWITCH_DELAY_MS)
+        self.tab_switch_timer.timeout.connect(self.display_content_for_active_tab)
+        self.viewer_tab.currentChanged.connect(self.on_viewer_tab_changed)
 
         # disable all tabs before loading an image file
         self.enable_tabs(False)
 
+    def add_lazy_tab(self, tabs, title, attr_name, factory):
+        """Add a placeholder tab whose widget is built by factory when the tab is first shown."""
+        placeholder = QWidget()
+        self._tab_factories[placeholder] = (attr_name, factory)
+        setattr(self, attr_name, None)
+        tabs.addTab(placeholder, title)
+
+    def materialize_tab(self, tabs, index):
+        """Replace the placeholder at index with its real widget, if it hasn't been built yet."""
+        placeholder = tabs.widget(index)
+        entry = self._tab_factories.pop(placeholder, None)
+        if entry is None:
+            return
+        attr_name, factory = entry
+        widget = factory()
+        setattr(self, attr_name, widget)
+
+        title = tabs.tabText(index)
+        signals_blocked = tabs.blockSignals(True)
+        tabs.removeTab(index)
+        tabs.insertTab(index, widget, title)
+        tabs.setCurrentIndex(index)
+        tabs.blockSignals(signals_blocked)
+        placeholder.deleteLater()
+
+    def create_deleted_files_widget(self):
+        widget = FileCarvingWidget(self)
+        if self.image_handler is not None:
+            widget.set_image_handler(self.image_handler)
+        return widget
+
+    def create_application_viewer(self):
+        viewer = UnifiedViewer(self)
+        viewer.layout.setContentsMargins(0, 0, 0, 0)
+        viewer.layout.setSpacing(0)
+        return viewer
+
+    def create_virus_total_widget(self):
+        widget = VirusTotal()
+        # Set the API key if it exists
+        widget.set_api_key(self.api_keys.get('API_KEYS', 'virustotal', fallback=''))
+        return widget
+
     def apply_stylesheet(self, theme='light'):
-        if theme == 'dark':
-            qss_file = 'styles/dark_theme.qss'
-        else:
-            qss_file = 'styles/light_theme.qss'  # Ensure your existing QSS file is named 'light_theme.qss'
+        stylesheet = STYLESHEETS.get('dark' if theme == 'dark' else 'light')
 
-        try:
-            with open(qss_file, 'r') as f:
-                stylesheet = f.read()
-            QApplication.instance().setStyleSheet(stylesheet)
-        except Exception as e:
-            print(f"Error loading stylesheet {qss_file}: {e}")
+        # Setting a stylesheet restyles every widget, so skip it when nothing changed
+        if stylesheet is None or stylesheet == self._current_qss:
+            return
+        QApplication.instance().setStyleSheet(stylesheet)
+        self._current_qss = stylesheet
 
     def show_api_key_dialog(self):
         # Create a dialog to get API keys from the user
@@ -365,16 +700,18 @@ class MainWindow(QMainWindow):
         self.api_keys.set('API_KEYS', 'virustotal', virus_total_key)
         self.api_keys.set('API_KEYS', 'veriphone', veriphone_key)
 
-        with open('config.ini', 'w') as config_file:
+        with open(CONFIG_FILE, 'w') as config_file:
             self.api_keys.write(config_file)
+        _CONFIG_CACHE[CONFIG_FILE] = (os.stat(CONFIG_FILE).st_mtime_ns, self.api_keys)
 
         dialog.accept()
 
         # Pass the updated API keys to the appropriate modules
-        self.virus_total_api.set_api_key(virus_total_key)
+        if self.virus_total_api is not None:
+            self.virus_total_api.set_api_key(virus_total_key)
 
         # Set Veriphone API key only if the widget is created
-        if hasattr(self, 'veriphone_widget'):
+        if self.veriphone_widget is not None:
             self.veriphone_widget.set_api_key(veriphone_key)
 
     def show_conversion_widget(self):
@@ -384,7 +721,7 @@ class MainWindow(QMainWindow):
 
     def show_veriphone_widget(self):
         # Create the VeriphoneWidget only if it hasn't been created yet
-        if not hasattr(self, 'veriphone_widget'):
+        if self.veriphone_widget is None:
             self.veriphone_widget = VeriphoneWidget()
             # Set the API key after creating the widget
             veriphone_key = self.api_keys.get('API_KEYS', 'veriphone', fallback='')
@@ -409,54 +746,48 @@ class MainWindow(QMainWindow):
         self.result_viewer.setEnabled(state)
         self.viewer_tab.setEnabled(state)
         self.listing_table.setEnabled(state)
-        self.deleted_files_widget.setEnabled(state)
-        self.registry_extractor_widget.setEnabled(state)
+        if self.deleted_files_widget is not None:
+            self.deleted_files_widget.setEnabled(state)
+        if self.registry_extractor_widget is not None:
+            self.registry_extractor_widget.setEnabled(state)
 
-    def create_menu(self, menu_bar, menu_name, actions):
+    def create_menu(self, menu_name, actions):
+        """Build a menu from (name, function) pairs; a None name adds a separator."""
         menu = QMenu(menu_name, self)
-        for action_name, action_function in actions.items():
-            if action_name.startswith('separator') or action_function is None:
+        for action_name, action_function in actions:
+            if action_name is None:
                 menu.addSeparator()
             else:
-                action = menu.addAction(action_name)
-                action.triggered.connect(action_function)
-        menu_bar.addMenu(menu)
+                menu.addAction(action_name).triggered.connect(action_function)
         return menu
 
-    @staticmethod
-    def create_tree_item(parent, text, icon_path, data):
-        item = QTreeWidgetItem(parent)
-        item.setText(0, text)
-        item.setIcon(0, QIcon(icon_path))
-        item.setData(0, Qt.UserRole, data)
-        return item
-
-    def on_viewer_dock_focus(self, visible):
-        if visible:  # If the QDockWidget is focused/visible
-            self.viewer_dock.setMaximumSize(16777215, 16777215)  # Remove size constraints
-        else:  # If the QDockWidget loses focus
-            current_height = self.viewer_dock.size().height()  # Get the current height
-            self.viewer_dock.setMinimumSize(1200, current_height)
-            self.viewer_dock.setMaximumSize(1200, current_height)
+    def create_tree_item(self, parent_index, text, icon_path, data, lazy=False):
+        return self.tree_model.add_node(parent_index, text, icon_path, data, lazy)
 
     def clear_ui(self):
-        self.listing_table.clearContents()
-        self.listing_table.setRowCount(0)
+        self.listing_model.clear()
         self.clear_viewers()
         self.current_image_path = None
         self.current_offset = None
         self.image_mounted = False
-        self.file_search_widget.clear()
+        if self.file_search_widget is not None:
+            self.file_search_widget.clear()
         self.evidence_files.clear()
-        self.deleted_files_widget.clear()
+        if self.deleted_files_widget is not None:
+            self.deleted_files_widget.clear()
 
     def clear_viewers(self):
         self.hex_viewer.clear_content()
-        self.text_viewer.clear_content()
-        self.application_viewer.clear()
-        self.metadata_viewer.clear()
-        self.exif_viewer.clear_content()
-        self.registry_extractor_widget.clear()
+        if self.text_viewer is not None:
+            self.text_viewer.clear_content()
+        if self.application_viewer is not None:
+            self.application_viewer.clear()
+        if self.metadata_viewer is not None:
+            self.metadata_viewer.clear()
+        if self.exif_viewer is not None:
+            self.exif_viewer.clear_content()
+        if self.registry_extractor_widget is not None:
+            self.registry_extractor_widget.clear()
 
     def closeEvent(self, event):
         reply = QMessageBox.question(self, 'Exit Confirmation', 'Are you sure you want to exit?',
@@ -474,10 +805,18 @@ class MainWindow(QMainWindow):
                     # Assuming you have a method to dismount the image
                     self.image_manager.dismount_image()
 
+            self._bg_executor.shutdown(wait=False, cancel_futures=True)
             event.accept()
         else:
             event.ignore()
 
+    def on_image_operation_completed(self, success, message):
+        if success:
+            QMessageBox.information(self, "Image Operation", message)
+            self.image_mounted = not self.image_mounted
+        else:
+            QMessageBox.critical(self, "Image Operation", message)
+
     def open_file_acquisition(self):
         """Open the file acquisition dialog."""
         dialog = FileAcquisitionDialog(self)
@@ -490,37 +829,31 @@ class MainWindow(QMainWindow):
     
     def load_image_evidence(self):
         """Open an image with a specific filter on Kali Linux."""
-        # Define the supported image file extensions, including both lowercase and uppercase variants
-        supported_image_extensions = ["*.e01", "*.E01", "*.s01", "*.S01",
-                                      "*.l01", "*.L01", "*.raw", "*.RAW",
-                                      "*.img", "*.IMG", "*.dd", "*.DD",
-                                      "*.iso", "*.ISO", "*.ad1", "*.AD1",
-                                      "*.001", "*.s01", "*.ex01", "*.dmg",
-                                      "*.sparse", "*.sparseimage"]
-
-        # Construct the file filter string with both uppercase and lowercase extensions
-        file_filter = "Supported Image Files ({})".format(" ".join(supported_image_extensions))
-
         # Open file dialog with the specified file filter
-        image_path, _ = QFileDialog.getOpenFileName(self, "Select Image", "", file_filter)
+        image_path, _ = QFileDialog.getOpenFileName(self, "Select Image", "", IMAGE_FILE_FILTER)
 
         if image_path:
             image_path = os.path.normpath(image_path)
             # Create ImageHandler (now loads only basic info, much faster)
             self.image_handler = ImageHandler(image_path)
-            self.evidence_files.append(image_path)
+            # Reopening an image replaces its existing tree instead of adding a second one
+            self.remove_from_tree_viewer(image_path)
             self.current_image_path = image_path
             # Load partitions asynchronously to avoid blocking UI
-            self.load_partitions_into_tree_async(image_path)
-
-            # Pass the image handler to the widgets
-            self.deleted_files_widget.set_image_handler(self.image_handler)
-            self.registry_extractor_widget.image_handler = self.image_handler
-            self.file_search_widget.image_handler = self.image_handler
+            self.evidence_files[image_path] = self.load_partitions_into_tree_async(image_path)
+
+            # Pass the image handler to the widgets that have been built; the rest pick it up when created
+            if self.deleted_files_widget is not None:
+                self.deleted_files_widget.set_image_handler(self.image_handler)
+            if self.registry_extractor_widget is not None:
+                self.registry_extractor_widget.image_handler = self.image_handler
+            if self.file_search_widget is not None:
+                self.file_search_widget.image_handler = self.image_handler
             # Update mind map widget with new image handler
-            if hasattr(self, 'mind_map_widget'):
+            if self.mind_map_widget is not None:
                 self.mind_map_widget.set_image_handler(self.image_handler)
-            self.metadata_viewer.image_handler = self.image_handler
+            if self.metadata_viewer is not None:
+                self.metadata_viewer.image_handler = self.image_handler
 
             self.enable_tabs(True)
 
@@ -530,7 +863,7 @@ class MainWindow(QMainWindow):
             return
 
         # Prepare the options for the dialog
-        options = self.evidence_files + ["Remove All"]
+        options = list(self.evidence_files) + ["Remove All"]
         selected_option, ok = QInputDialog.getItem(self, "Remove Evidence File",
                                                    "Select an evidence file to remove or 'Remove All':",
                                                    options, 0, False)
@@ -538,12 +871,11 @@ class MainWindow(QMainWindow):
         if ok:
             if selected_option == "Remove All":
                 # Remove all evidence files
-                self.tree_viewer.invisibleRootItem().takeChildren()  # Remove all children from the tree viewer
+                self.tree_model.clear()  # Remove all items from the tree viewer
                 self.clear_ui()  # Clear the UI
                 QMessageBox.information(self, "Remove Evidence", "All evidence files have been removed.")
             else:
                 # Remove the selected evidence file
-                self.evidence_files.remove(selected_option)
                 self.remove_from_tree_viewer(selected_option)
                 self.clear_ui()
                 QMessageBox.information(self, "Remove Evidence", f"{selected_option} has been removed.")
@@ -556,29 +888,28 @@ class MainWindow(QMainWindow):
             self.verify_image_button.setIcon(QIcon('Icons/icons8-verify-blue.png'))
 
     def remove_from_tree_viewer(self, evidence_name):
-        root = self.tree_viewer.invisibleRootItem()
-        for i in range(root.childCount()):
-            item = root.child(i)
-            if item.text(0) == evidence_name:
-                root.removeChild(item)
-                break
+        root_index = self.evidence_files.pop(evidence_name, None)
+        if root_index is not None:
+            self.tree_model.remove_top_level(QModelIndex(root_index))
 
     def load_partitions_into_tree_async(self, image_path):
         """Load partitions from an image into the tree viewer asynchronously."""
-        # Pre-fetch icon paths on main thread (SQLite must be accessed on main thread)
+        # Icon lookups are in-memory, so these are resolved here and handed to the loader callback
         media_icon = self.db_manager.get_icon_path('device', 'media-optical')
         drive_icon = self.db_manager.get_icon_path('device', 'drive-harddisk')
         unknown_icon = self.db_manager.get_icon_path('file', 'unknown')
         
-        # Create root item immediately for faster UI response
-        root_item_tree = self.create_tree_item(self.tree_viewer, image_path,
-                                               media_icon,
-                                               {"start_offset": 0})
+        # Create root item immediately for faster UI response; the persistent index stays
+        # valid (or becomes invalid if the evidence is removed) while the partitions load
+        root_item_tree = QPersistentModelIndex(self.create_tree_item(QModelIndex(), image_path,
+                                                                     media_icon,
+                                                                     {"start_offset": 0}))
         
-        # Use ThreadPoolExecutor to load partitions in background
-        executor = ThreadPoolExecutor(max_workers=1)
-        future = executor.submit(self._load_partitions_worker, image_path)
-        future.add_done_callback(lambda f: self._on_partitions_loaded(f, root_item_tree, drive_icon, unknown_icon))
+        # Load partitions in background; the signal delivers the result on the GUI thread
+        self._bg_executor.submit(
+            lambda: self.partitionsLoaded.emit(self._load_partitions_worker(image_path), root_item_tree,
+                                               drive_icon, unknown_icon))
+        return root_item_tree
 
     def _load_partitions_worker(self, image_path):
         """Worker function to load partitions in background thread."""
@@ -587,12 +918,7 @@ class MainWindow(QMainWindow):
             
             # Check if the image has partitions or a recognizable file system
             if not partitions:
-                has_fs = self.image_handler.has_filesystem(0)
-                return {
-                    'has_partitions': False,
-                    'has_filesystem': has_fs,
-                    'partitions': []
-                }
+                return PartitionLoadResult(has_filesystem=self.image_handler.has_filesystem(0))
             
             # Load partition info (defer filesystem type checking)
             partition_data = []
@@ -603,46 +929,30 @@ class MainWindow(QMainWindow):
                 desc_str = desc.decode('utf-8') if isinstance(desc, bytes) else desc
                 
                 # Skip filesystem type check here - it's slow, do it lazily
-                partition_data.append({
-                    'addr': addr,
-                    'desc': desc_str,
-                    'start': start,
-                    'end': end,
-                    'length': length,
-                    'readable_size': readable_size
-                })
+                partition_data.append(PartitionInfo(addr, desc_str, start, end, length, readable_size))
             
-            return {
-                'has_partitions': True,
-                'has_filesystem': False,
-                'partitions': partition_data
-            }
+            return PartitionLoadResult(has_partitions=True, partitions=partition_data)
         except Exception as e:
             import traceback
-            return {
-                'error': str(e),
-                'traceback': traceback.format_exc(),
-                'has_partitions': False,
-                'partitions': []
-            }
+            return PartitionLoadResult(error=str(e), traceback=traceback.format_exc())
 
-    def _on_partitions_loaded(self, future, root_item_tree, drive_icon, unknown_icon):
+    def _on_partitions_loaded(self, result, root_item_tree, drive_icon, unknown_icon):
         """Callback when partitions are loaded - update UI on main thread."""
         try:
-            result = future.result()
+            if not root_item_tree.isValid():
+                return  # The evidence was removed while loading
+            root_item_tree = QModelIndex(root_item_tree)
             
-            if result.get('error'):
+            if result.error:
                 # Show error with traceback if available
-                error_msg = result.get('error', 'Unknown error')
-                traceback_msg = result.get('traceback', '')
-                print(f"Error loading partitions: {error_msg}")
-                if traceback_msg:
-                    print(f"Traceback: {traceback_msg}")
+                print(f"Error loading partitions: {result.error}")
+                if result.traceback:
+                    print(f"Traceback: {result.traceback}")
                 return
             
-            if not result.get('has_partitions'):
+            if not result.has_partitions:
                 # No partitions - check for filesystem or unallocated
-                if result.get('has_filesystem'):
+                if result.has_filesystem:
                     # The image has a filesystem but no partitions, populate root directory
                     self.populate_contents(root_item_tree, {"start_offset": 0})
                 else:
@@ -657,34 +967,32 @@ class MainWindow(QMainWindow):
                 return
 
             # Add partitions to tree (filesystem type will be checked lazily on expand)
-            for part_data in result['partitions']:
-                addr = part_data['addr']
-                desc_str = part_data['desc']
-                start = part_data['start']
-                end = part_data['end']
-                readable_size = part_data['readable_size']
+            for part_data in result.partitions:
+                addr = part_data.addr
+                desc_str = part_data.desc
+                start = part_data.start
+                end = part_data.end
+                readable_size = part_data.readable_size
                 
                 # Defer filesystem type check - just show "Loading..." or skip it
                 item_text = f"vol{addr} ({desc_str}: {start}-{end}, Size: {readable_size})"
                 data = {"inode_number": None, "start_offset": start, "end_offset": end}
-                item = self.create_tree_item(root_item_tree, item_text, drive_icon, data)
 
                 # Determine if the partition is special or contains unallocated space
                 special_partitions = ["Primary Table", "Safety Table", "GPT Header"]
                 is_special = any(special_case in desc_str for special_case in special_partitions)
                 is_unallocated = "Unallocated" in desc_str or "Microsoft reserved" in desc_str
 
-                if is_special:
-                    item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicator)
-                elif is_unallocated:
-                    item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
-                    # Directly add unallocated space under the partition
-                    self.create_tree_item(item, f"Unallocated Space: Size: {readable_size}",
-                                          unknown_icon,
-                                          {"is_unallocated": True, "start_offset": start, "end_offset": end})
+                if is_special or is_unallocated:
+                    item = self.create_tree_item(root_item_tree, item_text, drive_icon, data)
+                    if is_unallocated:
+                        # Directly add unallocated space under the partition
+                        self.create_tree_item(item, f"Unallocated Space: Size: {readable_size}",
+                                              unknown_icon,
+                                              {"is_unallocated": True, "start_offset": start, "end_offset": end})
                 else:
                     # Always show indicator - check contents lazily on expand
-                    item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+                    self.create_tree_item(root_item_tree, item_text, drive_icon, data, lazy=True)
         except Exception as e:
             import traceback
             print(f"Error loading partitions: {e}")
@@ -692,90 +1000,100 @@ class MainWindow(QMainWindow):
 
     def load_partitions_into_tree(self, image_path):
         """Load partitions from an image into the tree viewer (synchronous version for compatibility)."""
-        self.load_partitions_into_tree_async(image_path)
+        return self.load_partitions_into_tree_async(image_path)
+
+    def load_children_async(self, index, load_children):
+        """Show a placeholder under index and fill in the (nodes, new text) from load_children() in the background."""
+        self.tree_model.add_nodes(index, [TreeNode(LOADING_TEXT, '', None)])
+        self._bg_executor.submit(self._load_children_worker, QPersistentModelIndex(index), load_children)
 
-    def populate_contents(self, item, data, inode=None):
+    def _load_children_worker(self, index, load_children):
+        """Worker function to read tree items in background thread."""
+        try:
+            nodes, text = load_children()
+        except Exception as e:
+            print(f"Error loading tree items: {e}")
+            nodes, text = [], None
+        self.childrenLoaded.emit(index, nodes, text)
+
+    def _on_children_loaded(self, index, nodes, text):
+        if not index.isValid():
+            return  # The evidence was removed while loading
+        index = QModelIndex(index)
+        if text is not None:
+            self.tree_model.set_text(index, text)
+        self.tree_model.set_children(index, nodes)
+
+    def populate_contents(self, index, data, inode=None, show_fs_type=False):
         if self.current_image_path is None:
             return
 
-        entries = self.image_handler.get_directory_contents(data["start_offset"], inode)
+        image_handler = self.image_handler
+        start_offset = data["start_offset"]
+        item_text = index.data()
 
-        for entry in entries:
-            child_item = QTreeWidgetItem(item)
-            child_item.setText(0, entry["name"])
+        def load_children():
+            text = None
+            if show_fs_type:
+                fs_type = image_handler.get_fs_type(start_offset)
+                if fs_type != "N/A" and "FS:" not in item_text:
+                    text = f"{item_text}, FS: {fs_type}"
 
-            if entry["is_directory"]:
-                sub_entries = self.image_handler.get_directory_contents(data["start_offset"], entry["inode_number"])
-                has_sub_entries = bool(sub_entries)
+            entries = image_handler.get_directory_contents(start_offset, inode)
 
-                self.populate_item(child_item, entry["name"], entry["inode_number"], data["start_offset"],
-                                   is_directory=True)
-                child_item.setChildIndicatorPolicy(
-                    QTreeWidgetItem.ShowIndicator if has_sub_entries else QTreeWidgetItem.DontShowIndicatorWhenChildless)
-            else:
-                self.populate_item(child_item, entry["name"], entry["inode_number"], data["start_offset"],
-                                   is_directory=False)
+            # Directories are only listed when they are expanded, so they aren't read here
+            nodes = [self.populate_item(entry["name"], entry["inode_number"], start_offset,
+                                        is_directory=entry["is_directory"])
+                     for entry in entries]
+            return nodes, text
 
-    def populate_item(self, child_item, entry_name, inode_number, start_offset, is_directory):
-        if is_directory:
-            icon_key = 'folder'
-        else:
-            # For files, determine the icon based on the file extension
-            file_extension = entry_name.split('.')[-1].lower() if '.' in entry_name else 'unknown'
-            icon_key = file_extension
+        self.load_children_async(index, load_children)
 
-        icon_path = self.db_manager.get_icon_path('folder' if is_directory else 'file', icon_key)
+    def populate_item(self, entry_name, inode_number, start_offset, is_directory):
+        # For files, determine the icon based on the file extension
+        icon_key = 'folder' if is_directory else file_icon_key(entry_name)
 
-        child_item.setIcon(0, QIcon(icon_path))
+        icon_path = self.db_manager.get_icon_path('folder' if is_directory else 'file', icon_key)
         
-        # Check if file is a ZIP file
-        is_zip = False
-        if not is_directory:
-            is_zip = self._is_zip_file(entry_name, inode_number, start_offset)
+        # Check if file is a ZIP file (by name only; other ZIPs are recognised when clicked)
+        is_zip = not is_directory and self._is_zip_file(entry_name)
         
-        child_item.setData(0, Qt.UserRole, {
+        data = {
             "inode_number": inode_number,
             "type": 'directory' if is_directory else ('zip' if is_zip else 'file'),
             "start_offset": start_offset,
             "name": entry_name,
             "is_zip": is_zip
-        })
+        }
         
-        # If it's a ZIP file, show indicator that it can be expanded
-        if is_zip:
-            child_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
-
-    def on_item_expanded(self, item):
-        # Check if the item already has children; if so, don't repopulate
-        if item.childCount() > 0:
-            return
+        # Directories and ZIP files can be expanded
+        return TreeNode(entry_name, icon_path, data, lazy=is_directory or is_zip)
 
-        data = item.data(0, Qt.UserRole)
+    def on_item_expanded(self, index):
+        data = index.data(Qt.UserRole)
         if data is None:
             return
 
         if data.get("inode_number") is None:  # It's a partition
             # Update partition text with filesystem type if not already shown
-            start_offset = data.get("start_offset")
-            if start_offset is not None:
-                fs_type = self.image_handler.get_fs_type(start_offset)
-                if fs_type != "N/A":
-                    current_text = item.text(0)
-                    if "FS:" not in current_text:
-                        item.setText(0, f"{current_text}, FS: {fs_type}")
-            self.populate_contents(item, data)
+            self.populate_contents(index, data, show_fs_type=True)
         elif data.get("type") == "zip":  # It's a ZIP file
-            self.populate_zip_contents(item, data)
+            self.populate_zip_contents(index, data)
         else:  # It's a directory
-            self.populate_contents(item, data, data.get("inode_number"))
+            self.populate_contents(index, data, data.get("inode_number"))
 
-    def on_item_clicked(self, item, column):
+    def on_item_clicked(self, index):
         self.clear_viewers()
 
-        data = item.data(0, Qt.UserRole)
+        data = index.data(Qt.UserRole)
         if data is None:
             return
         
+        if (data.get("type") == "file" and data.get("inode_number") is not None
+                and self._has_zip_signature(data["inode_number"], data["start_offset"])):
+            # A ZIP without a ZIP extension; from now on it is shown and expanded as one
+            data = self.tree_model.mark_as_zip(index)
+
         self.current_selected_data = data
 
         if data.get("is_unallocated"):
@@ -810,12 +1128,9 @@ class MainWindow(QMainWindow):
             if zip_parent_inode and zip_path:
                 if data.get("is_directory"):
                     # For directories in ZIP, show contents
-                    zip_entries = self._get_zip_contents(zip_parent_inode, zip_parent_offset)
-                    if zip_entries:
-                        # Filter entries that are in this directory
-                        dir_entries = [e for e in zip_entries if e["zip_path"].startswith(zip_path) and e["zip_path"] != zip_path]
-                        if dir_entries:
-                            self.populate_listing_table(dir_entries, zip_parent_offset, is_zip=True)
+                    dir_entries = self._get_zip_directory_entries(zip_parent_inode, zip_parent_offset, zip_path)
+                    if dir_entries:
+                        self.populate_listing_table(dir_entries, zip_parent_offset, is_zip=True)
                 else:
                     # For files in ZIP, extract and display
                     entry_content = self._extract_zip_entry(zip_parent_inode, zip_parent_offset, zip_path)
@@ -841,7 +1156,12 @@ class MainWindow(QMainWindow):
 
         self.display_content_for_active_tab()
 
+    def on_viewer_tab_changed(self, index):
+        self.materialize_tab(self.viewer_tab, index)
+        self.tab_switch_timer.start()
+
     def display_content_for_active_tab(self):
+        self.materialize_tab(self.viewer_tab, self.viewer_tab.currentIndex())
         if not self.current_selected_data:
             return
 
@@ -868,13 +1188,22 @@ class MainWindow(QMainWindow):
         elif index == 4:  # Exif Data tab
             self.exif_viewer.load_and_display_exif_data(file_content)
         elif index == 5:  # Assuming VirusTotal tab is the 6th tab (0-based index)
-            file_hash = hashlib.md5(file_content).hexdigest()
-            self.virus_total_api.set_file_hash(file_hash)
+            # The hash is filled in once the background hasher is done with it
+            self.virus_total_api.set_file_hash(None)
             self.virus_total_api.set_file_content(file_content, data.get("name", ""))
+            self._bg_executor.submit(self._hash_file_worker, file_content)
 
-    def populate_listing_table(self, entries, offset, is_zip=False):
-        self.listing_table.setRowCount(0)
+    def _hash_file_worker(self, file_content):
+        """Worker function to hash file content in background thread."""
+        self.fileHashed.emit(file_content, hashlib.md5(file_content).hexdigest())
 
+    def _on_file_hashed(self, file_content, file_hash):
+        # Drop hashes of files that are no longer the one shown in the VirusTotal tab
+        if self.virus_total_api is not None and self.virus_total_api.current_file_content is file_content:
+            self.virus_total_api.set_file_hash(file_hash)
+
+    def populate_listing_table(self, entries, offset, is_zip=False):
+        rows = []
         for entry in entries:
             entry_name = entry["name"]
             # For ZIP entries, inode_number is None, use a placeholder
@@ -887,8 +1216,7 @@ class MainWindow(QMainWindow):
             accessed = entry["accessed"] if "accessed" in entry else None
             modified = entry["modified"] if "modified" in entry else None
             changed = entry["changed"] if "changed" in entry else None
-            icon_name, icon_type = ('folder', 'folder') if entry["is_directory"] else (
-                'file', entry_name.split('.')[-1].lower() if '.' in entry_name else 'unknown')
+            icon_name, icon_type = ('folder', 'folder') if entry["is_directory"] else ('file', file_icon_key(entry_name))
 
             # Store ZIP entry info in data if it's a ZIP entry
             zip_data = None
@@ -901,18 +1229,16 @@ class MainWindow(QMainWindow):
                     "is_directory": entry["is_directory"]
                 }
 
-            self.insert_row_into_listing_table(entry_name, inode_number, description, icon_type, icon_name, offset,
-                                               readable_size, created, accessed, modified, changed, zip_data=zip_data)
+            rows.append(self.build_listing_row(entry_name, inode_number, description, icon_type, icon_name, offset,
+                                               readable_size, size_in_bytes, created, accessed, modified, changed,
+                                               zip_data=zip_data))
 
-    def insert_row_into_listing_table(self, entry_name, entry_inode, description, icon_name, icon_type, offset, size,
-                                      created, accessed, modified, changed, zip_data=None):
-        icon_path = self.db_manager.get_icon_path(icon_type, icon_name)
-        icon = QIcon(icon_path)
-        row_position = self.listing_table.rowCount()
-        self.listing_table.insertRow(row_position)
+        # Hand the model every row at once instead of inserting them one by one
+        self.listing_model.set_rows(rows)
 
-        name_item = QTableWidgetItem(entry_name)
-        name_item.setIcon(icon)
+    def build_listing_row(self, entry_name, entry_inode, description, icon_name, icon_type, offset, size,
+                          size_in_bytes, created, accessed, modified, changed, zip_data=None):
+        icon_path = self.db_manager.get_icon_path(icon_type, icon_name)
         
         # Build data dictionary
         item_data = {
@@ -926,37 +1252,18 @@ class MainWindow(QMainWindow):
         # Add ZIP data if provided
         if zip_data:
             item_data.update(zip_data)
-        
-        name_item.setData(Qt.UserRole, item_data)
-
-        self.listing_table.setItem(row_position, 0, name_item)
-        self.listing_table.setItem(row_position, 1, QTableWidgetItem(str(entry_inode)))
-        self.listing_table.setItem(row_position, 2, QTableWidgetItem(description))
-        self.listing_table.setItem(row_position, 3, QTableWidgetItem(size))
-        self.listing_table.setItem(row_position, 4, QTableWidgetItem(str(created)))
-        self.listing_table.setItem(row_position, 5, QTableWidgetItem(str(accessed)))
-        self.listing_table.setItem(row_position, 6, QTableWidgetItem(str(modified)))
-        self.listing_table.setItem(row_position, 7, QTableWidgetItem(str(changed)))
-
-    def on_listing_table_item_clicked(self, item):
-        row = item.row()
-        column = item.column()
-
-        inode_item = self.listing_table.item(row, 1)
-        if not inode_item:
+
+        return (entry_name, entry_inode, description, size, created, accessed, modified, changed,
+                size_in_bytes, icon_path, item_data)
+
+    def on_listing_table_item_clicked(self, index):
+        data = index.siblingAtColumn(0).data(Qt.UserRole)
+        if not data:
             return
-        
+
         try:
-            inode_number = int(inode_item.text())
-        except (ValueError, AttributeError):
-            return
-        
-        name_item = self.listing_table.item(row, 0)
-        if not name_item:
-            return
-        
-        data = name_item.data(Qt.UserRole)
-        if not data:
+            inode_number = int(data.get("inode_number"))
+        except (ValueError, TypeError):
             return
 
         self.current_selected_data = data
@@ -973,12 +1280,9 @@ class MainWindow(QMainWindow):
             if zip_parent_inode and zip_path:
                 if data.get("is_directory"):
                     # For directories in ZIP, show contents
-                    zip_entries = self._get_zip_contents(zip_parent_inode, zip_parent_offset)
-                    if zip_entries:
-                        # Filter entries that are in this directory
-                        dir_entries = [e for e in zip_entries if e["zip_path"].startswith(zip_path) and e["zip_path"] != zip_path]
-                        if dir_entries:
-                            self.populate_listing_table(dir_entries, zip_parent_offset, is_zip=True)
+                    dir_entries = self._get_zip_directory_entries(zip_parent_inode, zip_parent_offset, zip_path)
+                    if dir_entries:
+                        self.populate_listing_table(dir_entries, zip_parent_offset, is_zip=True)
                 else:
                     # For files in ZIP, extract and display
                     entry_content = self._extract_zip_entry(zip_parent_inode, zip_parent_offset, zip_path)
@@ -1009,16 +1313,9 @@ class MainWindow(QMainWindow):
         # Get the selected item
         indexes = self.listing_table.selectedIndexes()
         if indexes:
-            selected_item = self.listing_table.item(indexes[0].row(),
-                                                    0)  # Assuming the first column contains the item data
-            data = selected_item.data(Qt.UserRole)
-            menu = QMenu()
-
-            # Add the 'Export' option for any file or folder
-            export_action = menu.addAction("Export")
-            export_action.triggered.connect(lambda: self.export_item_from_table(data))
-
-            menu.exec_(self.listing_table.viewport().mapToGlobal(position))
+            # The first column holds the item data
+            self.listing_context_data = indexes[0].siblingAtColumn(0).data(Qt.UserRole)
+            self.listing_context_menu.popup(self.listing_table.viewport().mapToGlobal(position))
 
     def export_item_from_table(self, data):
         dest_dir = QFileDialog.getExistingDirectory(self, "Select Destination Directory")
@@ -1028,35 +1325,39 @@ class MainWindow(QMainWindow):
             else:
                 self.export_file(data["inode_number"], data["start_offset"], dest_dir, data["name"])
 
+    def create_context_menus(self):
+        """Build the tree and listing context menus once; opening them only updates their actions."""
+        self.tree_context_menu = QMenu(self.tree_viewer)
+        self.view_os_info_action = self.tree_context_menu.addAction("View Image Information")
+        self.view_os_info_action.triggered.connect(
+            lambda: self.view_os_information(self.tree_viewer.selectedIndexes()[0]))
+        # Add the 'Export' option for any file or folder
+        self.tree_context_menu.addAction("Export").triggered.connect(self.export_item)
+
+        self.listing_context_menu = QMenu(self.listing_table)
+        self.listing_context_data = None
+        self.listing_context_menu.addAction("Export").triggered.connect(
+            lambda: self.export_item_from_table(self.listing_context_data))
+
     def open_tree_context_menu(self, position):
         # Get the selected item
         indexes = self.tree_viewer.selectedIndexes()
-        if indexes:
-            selected_item = self.tree_viewer.itemFromIndex(indexes[0])
-            menu = QMenu()
-
-            # Check if the selected item is a root item
-            if selected_item and selected_item.parent() is None:
-                view_os_info_action = menu.addAction("View Image Information")
-                view_os_info_action.triggered.connect(lambda: self.view_os_information(indexes[0]))
-
-            # Add the 'Export' option for any file or folder
-            export_action = menu.addAction("Export")
-            export_action.triggered.connect(self.export_item)
-
-            menu.exec_(self.tree_viewer.viewport().mapToGlobal(position))
+        if indexes and indexes[0].data(Qt.UserRole) is not None:
+            # Image information is only offered for root items
+            self.view_os_info_action.setVisible(not indexes[0].parent().isValid())
+            self.tree_context_menu.popup(self.tree_viewer.viewport().mapToGlobal(position))
 
     def export_item(self):
         indexes = self.tree_viewer.selectedIndexes()
         if indexes:
-            selected_item = self.tree_viewer.itemFromIndex(indexes[0])
-            data = selected_item.data(0, Qt.UserRole)
+            data = indexes[0].data(Qt.UserRole)
+            item_text = indexes[0].data()
             dest_dir = QFileDialog.getExistingDirectory(self, "Select Destination Directory")
             if dest_dir:
                 if data.get("type") == "directory":
-                    self.export_directory(data["inode_number"], data["start_offset"], dest_dir, selected_item.text(0))
+                    self.export_directory(data["inode_number"], data["start_offset"], dest_dir, item_text)
                 else:
-                    self.export_file(data["inode_number"], data["start_offset"], dest_dir, selected_item.text(0))
+                    self.export_file(data["inode_number"], data["start_offset"], dest_dir, item_text)
 
     def export_directory(self, inode_number, offset, dest_dir, dir_name):
         new_dest_dir = os.path.join(dest_dir, dir_name)
@@ -1077,12 +1378,30 @@ class MainWindow(QMainWindow):
                 f.write(file_content)
 
     def view_os_information(self, index):
-        item = self.tree_viewer.itemFromIndex(index)
-        if item is None or item.parent() is not None:
+        if not index.isValid() or index.parent().isValid():
             # Ensure that only the root item triggers the OS information display
             return
 
-        partitions = self.image_handler.get_partitions()
+        # Reading the registry of every NTFS partition is slow, so it happens in the background
+        self._bg_executor.submit(self._load_os_information_worker, self.image_handler)
+
+    def _load_os_information_worker(self, image_handler):
+        """Worker function to collect OS and file system information in background thread."""
+        rows = []
+        try:
+            for part in image_handler.get_partitions():
+                start_offset = part[2]  # Start offset of the partition
+                fs_type = image_handler.get_fs_type(start_offset)
+
+                os_version = None
+                if fs_type == "NTFS":
+                    os_version = image_handler.get_windows_version(start_offset)
+                rows.append((part[0], os_version, fs_type))
+        except Exception as e:
+            print(f"Error loading OS information: {e}")
+        self.osInformationLoaded.emit(rows)
+
+    def show_os_information(self, rows):
         table = QTableWidget()
 
         table.setColumnCount(3)
@@ -1094,16 +1413,9 @@ class MainWindow(QMainWindow):
         partition_icon = QIcon('Icons/devices/drive-harddisk.svg')  # Replace with your partition icon path
         os_icon = QIcon('Icons/start-here.svg')  # Replace with your OS icon path
 
-        for row, part in enumerate(partitions):
-            start_offset = part[2]  # Start offset of the partition
-            fs_type = self.image_handler.get_fs_type(start_offset)
-
-            os_version = None
-            if fs_type == "NTFS":
-                os_version = self.image_handler.get_windows_version(start_offset)
-
-            table.insertRow(row)
-            partition_item = QTableWidgetItem(f"Partition {part[0]}")
+        table.setRowCount(len(rows))
+        for row, (partition, os_version, fs_type) in enumerate(rows):
+            partition_item = QTableWidgetItem(f"Partition {partition}")
             partition_item.setIcon(partition_icon)
             os_version_item = QTableWidgetItem(os_version if os_version else "N/A")
             if os_version:
@@ -1130,87 +1442,121 @@ class MainWindow(QMainWindow):
 
         dialog.exec_()
     
-    def _is_zip_file(self, entry_name, inode_number, start_offset):
-        """Check if a file is a ZIP file by extension or magic bytes."""
-        # Check by extension first (faster)
-        if entry_name.lower().endswith(('.zip', '.jar', '.war', '.ear', '.apk')):
-            return True
-        
-        # Check by magic bytes (ZIP files start with PK\x03\x04 or PK\x05\x06)
-        try:
-            file_content, _ = self.image_handler.get_file_content(inode_number, start_offset)
-            if file_content and len(file_content) >= 4:
-                # Check for ZIP magic bytes
-                if file_content[:2] == b'PK':
-                    # Could be ZIP, JAR, DOCX, XLSX, PPTX, etc.
-                    # For now, treat all PK files as ZIP-like
-                    return True
-        except Exception:
-            pass
-        
-        return False
+    @staticmethod
+    def _is_zip_file(entry_name):
+        """Check if a file is a ZIP file by extension; no file data is read."""
+        return entry_name.lower().endswith(ZIP_EXTENSIONS)
+
+    def _has_zip_signature(self, inode_number, start_offset):
+        """Check if a file starts with ZIP magic bytes, reading only its first few bytes."""
+        header = self.image_handler.get_file_header(inode_number, start_offset)
+        return header is not None and header.startswith(ZIP_SIGNATURES)
     
+    def _get_zip_listing(self, inode_number, start_offset):
+        """Return (entries, entries by directory) for a ZIP file, parsing each archive's central directory only once."""
+        key = (self.image_handler.image_path, inode_number, start_offset)
+        listing = self.zip_contents_cache.lookup(key)
+        if listing is None:
+            listing = self._parse_zip_listing(self.image_handler, inode_number, start_offset)
+            if listing is not None:
+                self.zip_contents_cache.store(key, listing)
+        return listing
+
+    def _on_zip_listing_loaded(self, key, listing):
+        self.zip_contents_cache.store(key, listing)
+
+    def _parse_zip_listing(self, image_handler, inode_number, start_offset):
+        """Read a ZIP file's entries and index them by directory; safe to call from a worker thread."""
+        zip_entries = self._read_zip_contents(image_handler, inode_number, start_offset)
+        if zip_entries is None:
+            return None
+        return zip_entries, self._index_zip_entries(zip_entries)
+
+    @staticmethod
+    def _index_zip_entries(zip_entries):
+        """Map each directory path in a ZIP to every entry below it, in archive order."""
+        entries_by_dir = defaultdict(list)
+        for entry in zip_entries:
+            path = entry["zip_path"]
+            # Skip the entry's own trailing slash so a directory isn't listed inside itself
+            end = path.rfind('/', 0, len(path) - 1)
+            while end != -1:
+                entries_by_dir[path[:end + 1]].append(entry)
+                end = path.rfind('/', 0, end)
+        return dict(entries_by_dir)
+
     def _get_zip_contents(self, inode_number, start_offset):
+        """Return ZIP file contents as a list of entries."""
+        listing = self._get_zip_listing(inode_number, start_offset)
+        return listing[0] if listing else None
+
+    def _get_zip_directory_entries(self, inode_number, start_offset, zip_path):
+        """Return the entries below a directory of a ZIP file."""
+        listing = self._get_zip_listing(inode_number, start_offset)
+        return listing[1].get(zip_path, []) if listing else []
+
+    @staticmethod
+    def _read_zip_contents(image_handler, inode_number, start_offset):
         """Extract and return ZIP file contents as a list of entries."""
         try:
-            file_content, _ = self.image_handler.get_file_content(inode_number, start_offset)
-            if not file_content:
+            # zipfile seeks to the central directory, so only that part of the archive is read
+            zip_stream = image_handler.open_file(inode_number, start_offset)
+            if zip_stream is None:
                 return None
             
             # Check if it's actually a ZIP file
-            if not (file_content[:2] == b'PK'):
+            if zip_stream.peek(2)[:2] != b'PK':
+                zip_stream.close()
                 return None
             
             zip_entries = []
-            zip_file = zipfile.ZipFile(io.BytesIO(file_content), 'r')
-            
-            for zip_info in zip_file.infolist():
-                # Determine if it's a directory
-                is_directory = zip_info.filename.endswith('/')
+            with zip_stream, zipfile.ZipFile(zip_stream, 'r') as zip_file:
+                for zip_info in zip_file.infolist():
+                    # Determine if it's a directory
+                    is_directory = zip_info.filename.endswith('/')
                 
-                # Get file size
-                file_size = zip_info.file_size
+                    # Get file size
+                    file_size = zip_info.file_size
                 
-                # Get timestamps
-                date_time = zip_info.date_time
-                if date_time:
-                    # date_time is (year, month, day, hour, minute, second)
-                    try:
-                        from datetime import datetime
-                        dt = datetime(*date_time)
-                        created = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        modified = created
-                        accessed = created
-                        changed = created
-                    except Exception:
+                    # Get timestamps
+                    date_time = zip_info.date_time
+                    if date_time:
+                        # date_time is (year, month, day, hour, minute, second)
+                        try:
+                            from datetime import datetime
+                            dt = datetime(*date_time)
+                            created = dt.strftime('%Y-%m-%d %H:%M:%S')
+                            modified = created
+                            accessed = created
+                            changed = created
+                        except Exception:
+                            created = "N/A"
+                            modified = "N/A"
+                            accessed = "N/A"
+                            changed = "N/A"
+                    else:
                         created = "N/A"
                         modified = "N/A"
                         accessed = "N/A"
                         changed = "N/A"
-                else:
-                    created = "N/A"
-                    modified = "N/A"
-                    accessed = "N/A"
-                    changed = "N/A"
                 
-                # Create entry similar to directory entries
-                entry = {
-                    "name": zip_info.filename.rstrip('/'),
-                    "path": zip_info.filename,
-                    "size": file_size,
-                    "is_directory": is_directory,
-                    "inode_number": None,  # ZIP entries don't have inodes
-                    "created": created,
-                    "accessed": accessed,
-                    "modified": modified,
-                    "changed": changed,
-                    "zip_path": zip_info.filename,  # Store path in ZIP
-                    "zip_parent_inode": inode_number,  # Store parent ZIP inode
-                    "zip_parent_offset": start_offset  # Store parent ZIP offset
-                }
-                zip_entries.append(entry)
-            
-            zip_file.close()
+                    # Create entry similar to directory entries
+                    entry = {
+                        "name": zip_info.filename.rstrip('/'),
+                        "path": zip_info.filename,
+                        "size": file_size,
+                        "is_directory": is_directory,
+                        "inode_number": None,  # ZIP entries don't have inodes
+                        "created": created,
+                        "accessed": accessed,
+                        "modified": modified,
+                        "changed": changed,
+                        "zip_path": zip_info.filename,  # Store path in ZIP
+                        "zip_parent_inode": inode_number,  # Store parent ZIP inode
+                        "zip_parent_offset": start_offset  # Store parent ZIP offset
+                    }
+                    zip_entries.append(entry)
+
             return zip_entries
             
         except zipfile.BadZipFile:
@@ -1219,27 +1565,38 @@ class MainWindow(QMainWindow):
             print(f"Error extracting ZIP contents: {e}")
             return None
     
-    def populate_zip_contents(self, item, data):
+    def populate_zip_contents(self, index, data):
         """Populate tree view with ZIP file contents."""
+        image_handler = self.image_handler
         inode_number = data.get("inode_number")
         start_offset = data.get("start_offset")
-        
-        zip_entries = self._get_zip_contents(inode_number, start_offset)
-        if not zip_entries:
-            return
+        # The cache is only touched here and in the zipListingLoaded slot, both on the GUI thread
+        key = (image_handler.image_path, inode_number, start_offset)
+        cached_listing = self.zip_contents_cache.lookup(key)
+
+        def load_children():
+            listing = cached_listing
+            if listing is None:
+                listing = self._parse_zip_listing(image_handler, inode_number, start_offset)
+                if listing is None:
+                    return [], None
+                self.zipListingLoaded.emit(key, listing)
+            return self._zip_nodes(listing[0], start_offset), None
+
+        self.load_children_async(index, load_children)
+
+    def _zip_nodes(self, zip_entries, start_offset):
+        """Build tree nodes for the entries of a ZIP file."""
         
         # Group entries by directory structure
+        nodes = []
         for entry in zip_entries:
-            child_item = QTreeWidgetItem(item)
-            child_item.setText(0, entry["name"])
-            
             is_directory = entry["is_directory"]
-            icon_key = 'folder' if is_directory else (entry["name"].split('.')[-1].lower() if '.' in entry["name"] else 'unknown')
+            icon_key = 'folder' if is_directory else file_icon_key(entry["name"])
             icon_path = self.db_manager.get_icon_path('folder' if is_directory else 'file', icon_key)
-            child_item.setIcon(0, QIcon(icon_path))
             
             # Store ZIP entry data
-            child_item.setData(0, Qt.UserRole, {
+            entry_data = {
                 "type": 'zip_entry',
                 "name": entry["name"],
                 "zip_path": entry["zip_path"],
@@ -1248,23 +1605,22 @@ class MainWindow(QMainWindow):
                 "is_directory": is_directory,
                 "size": entry["size"],
                 "start_offset": start_offset
-            })
+            }
             
             # If it's a directory, show indicator
-            if is_directory:
-                child_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            nodes.append(TreeNode(entry["name"], icon_path, entry_data, lazy=is_directory))
+        return nodes
     
     def _extract_zip_entry(self, zip_parent_inode, zip_parent_offset, zip_path):
         """Extract a specific entry from a ZIP file."""
         try:
-            file_content, _ = self.image_handler.get_file_content(zip_parent_inode, zip_parent_offset)
-            if not file_content:
+            # Only the central directory and this entry's compressed bytes are read from the image
+            zip_stream = self.image_handler.open_file(zip_parent_inode, zip_parent_offset)
+            if zip_stream is None:
                 return None
             
-            zip_file = zipfile.ZipFile(io.BytesIO(file_content), 'r')
-            entry_content = zip_file.read(zip_path)
-            zip_file.close()
-            return entry_content
+            with zip_stream, zipfile.ZipFile(zip_stream, 'r') as zip_file:
+                return zip_file.read(zip_path)
         except Exception as e:
             print(f"Error extracting ZIP entry: {e}")
             return None
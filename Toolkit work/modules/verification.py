@@ -12,6 +12,7 @@ class HashCalculationThread(QThread):
         self.image_handler = image_handler
 
     def run(self):
+        # Verification has to re-read the image, not trust the stored hashes
         hash_results = self.image_handler.calculate_hashes()
         self.hashCalculated.emit(hash_results)
 
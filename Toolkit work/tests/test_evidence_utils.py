@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("pytsk3")
+
+from managers.evidence_utils import safe_datetime, utc_datetime
+
+
+def test_utc_datetime_formats_valid_timestamps():
+    assert utc_datetime(1600000000) == "2020-09-13 12:26:40 UTC"
+
+
+def test_utc_datetime_treats_zero_and_none_as_unset():
+    assert utc_datetime(0) == "N/A"
+    assert utc_datetime(None) == "N/A"
+
+
+@pytest.mark.parametrize("timestamp", [
+    1099511627776,  # year 36812
+    253402300800,   # 10000-01-01
+    -62135596801,   # year 0
+    2 ** 63 - 1,    # beyond the platform time_t
+])
+def test_out_of_range_timestamps_are_not_shown(timestamp):
+    assert safe_datetime(timestamp) == "N/A"
+    assert utc_datetime(timestamp) == "N/A"